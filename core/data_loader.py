@@ -3,9 +3,89 @@ Data loader for pendulum analysis.
 Handles loading and preprocessing CSV data.
 """
 
+import logging
+import os
+from functools import lru_cache
+
 import pandas as pd
 import numpy as np
-import os
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def _has_pyarrow():
+    """
+    Check whether pyarrow is installed, importing it on first use.
+    pyarrow is optional; when installed it provides a multithreaded CSV
+    parser and enables the Parquet cache of processed data. It is only
+    imported once a file is loaded, to keep it out of application start-up.
+    
+    Returns:
+        bool: True if pyarrow and its Parquet support can be imported
+    """
+    try:
+        import pyarrow  # noqa: F401
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+# Columns required for pendulum analysis; only these are read from the CSV
+REQUIRED_COLUMNS = [
+    'date_recorded', 'time_recorded',
+    'semi_major_axis', 'semi_minor_axis',
+    'rotation_angle_deg', 'eccentricity'
+]
+
+# Explicit column types so the parser does not have to infer them.
+# Eccentricity stays float64: its values sit within ~1e-5 of 1.0, which
+# float32 cannot resolve.
+COLUMN_DTYPES = {
+    'date_recorded': 'string',
+    'time_recorded': 'string',
+    'semi_major_axis': np.float32,
+    'semi_minor_axis': np.float32,
+    'rotation_angle_deg': np.float32,
+    'eccentricity': np.float64
+}
+
+# Files larger than this (in bytes) are parsed in chunks
+CHUNKED_READ_THRESHOLD = 100 * 1024 * 1024
+CHUNK_SIZE = 50_000
+
+# Columns whose (min, max) range is reported by get_data_summary
+SUMMARY_COLUMNS = [
+    'time', 'semi_major_axis', 'semi_minor_axis',
+    'rotation_angle_deg', 'eccentricity'
+]
+
+# Processed data is cached next to the CSV file as <file>.parquet. The
+# version is stored in the file metadata; bump it when processing changes.
+# The size and modification time of the CSV file it was made from are
+# stored too, and must match exactly for the cache to be used.
+SIDECAR_SUFFIX = '.parquet'
+SIDECAR_VERSION = b'3'
+SIDECAR_VERSION_KEY = b'pendulum_analysis_version'
+SIDECAR_SOURCE_SIZE_KEY = b'pendulum_analysis_source_size'
+SIDECAR_SOURCE_MTIME_KEY = b'pendulum_analysis_source_mtime_ns'
+
+# Format of the combined date_recorded and time_recorded columns
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def _stat_bytes(value):
+    """
+    Encode a file size or timestamp for the Parquet metadata.
+    
+    Args:
+        value (int): The value to encode
+        
+    Returns:
+        bytes: The value in decimal
+    """
+    return str(value).encode('ascii')
 
 
 class DataLoader:
@@ -18,6 +98,8 @@ class DataLoader:
         self.data = None
         self.filename = None
         self.is_loaded = False
+        # Cached (min, max) of the summarized columns, computed on demand
+        self._ranges = None
     
     def load_csv(self, filepath):
         """
@@ -30,57 +112,149 @@ class DataLoader:
             bool: True if successful, False otherwise
         """
         if not os.path.exists(filepath):
-            print(f"Error: File not found: {filepath}")
+            logger.error("File not found: %s", filepath)
             return False
         
+        # Cached summary ranges belong to the previous data
+        self._ranges = None
+        
         try:
-            # Load the data
-            self.data = pd.read_csv(filepath)
+            # Identify the file version being read, for the processed data cache
+            source_stat = os.stat(filepath)
+            
+            # Reuse previously processed data if an up-to-date cache exists
+            if _has_pyarrow() and self._read_sidecar(filepath, source_stat):
+                self.filename = os.path.basename(filepath)
+                self.is_loaded = True
+                logger.debug("Loaded cached data for: %s", filepath)
+                return True
+            
+            # Validate the header before reading the whole file
+            header = pd.read_csv(filepath, nrows=0)
+            if not self._validate_data(header.columns):
+                self.is_loaded = False
+                return False
+            
+            # Load only the required columns with known types
+            self.data = self._read_columns(filepath)
             self.filename = os.path.basename(filepath)
             self.is_loaded = True
             
-            print(f"Loaded CSV file: {filepath}")
-            print(f"Initial data shape: {self.data.shape}")
-            print(f"Initial columns: {self.data.columns.tolist()}")
+            logger.debug("Loaded CSV file: %s", filepath)
+            logger.debug("Initial data shape: %s", self.data.shape)
             
-            # Perform basic data validation
-            if self._validate_data():
-                # Calculate derived quantities if needed
-                if self._calculate_derived_values():
-                    print("Data processing complete.")
-                    return True
-                else:
-                    print("Failed to calculate derived values.")
-                    self.is_loaded = False
-                    return False
+            # Calculate derived quantities if needed
+            if self._calculate_derived_values():
+                logger.debug("Data processing complete")
+                if _has_pyarrow():
+                    self._write_sidecar(filepath, source_stat)
+                return True
             else:
+                logger.error("Failed to calculate derived values")
                 self.is_loaded = False
                 return False
                 
         except Exception as e:
-            print(f"Error loading CSV file: {e}")
+            logger.error("Error loading CSV file: %s", e)
             self.is_loaded = False
             return False
     
-    def _validate_data(self):
+    def _read_sidecar(self, filepath, source_stat):
         """
-        Validate that the loaded data has the required columns.
+        Load processed data from the Parquet cache of a CSV file.
+        The cache is only used if it was made from a CSV file of the same
+        size and modification time, so a replaced file is never served
+        stale data, even if its modification time is older.
         
+        Args:
+            filepath (str): Path to the CSV file
+            source_stat (os.stat_result): Status of the CSV file
+            
         Returns:
-            bool: True if data is valid, False otherwise
+            bool: True if an up-to-date cache was loaded, False otherwise
         """
-        # Check for required columns for pendulum analysis data
-        required_columns = [
-            'date_recorded', 'time_recorded', 
-            'semi_major_axis', 'semi_minor_axis', 
-            'rotation_angle_deg', 'eccentricity'
-        ]
+        sidecar_path = filepath + SIDECAR_SUFFIX
+        if not os.path.exists(sidecar_path):
+            return False
         
+        import pyarrow.parquet as pq
+        try:
+            metadata = pq.read_schema(sidecar_path).metadata or {}
+            if (metadata.get(SIDECAR_VERSION_KEY) != SIDECAR_VERSION or
+                    metadata.get(SIDECAR_SOURCE_SIZE_KEY) != _stat_bytes(source_stat.st_size) or
+                    metadata.get(SIDECAR_SOURCE_MTIME_KEY) != _stat_bytes(source_stat.st_mtime_ns)):
+                return False
+            self.data = pd.read_parquet(sidecar_path, engine='pyarrow')
+            return True
+        except Exception as e:
+            logger.warning("Ignoring unreadable cache %s: %s", sidecar_path, e)
+            return False
+    
+    def _write_sidecar(self, filepath, source_stat):
+        """
+        Save the processed data to a Parquet cache next to the CSV file.
+        Failure to write the cache is not an error.
+        
+        Args:
+            filepath (str): Path to the CSV file
+            source_stat (os.stat_result): Status of the CSV file when it was read
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+        
+        sidecar_path = filepath + SIDECAR_SUFFIX
+        try:
+            table = pa.Table.from_pandas(self.data, preserve_index=False)
+            metadata = dict(table.schema.metadata or {})
+            metadata[SIDECAR_VERSION_KEY] = SIDECAR_VERSION
+            metadata[SIDECAR_SOURCE_SIZE_KEY] = _stat_bytes(source_stat.st_size)
+            metadata[SIDECAR_SOURCE_MTIME_KEY] = _stat_bytes(source_stat.st_mtime_ns)
+            pq.write_table(table.replace_schema_metadata(metadata), sidecar_path, compression='zstd')
+        except Exception as e:
+            logger.warning("Could not write cache %s: %s", sidecar_path, e)
+    
+    def _read_columns(self, filepath):
+        """
+        Read the required columns from a CSV file.
+        Uses the pyarrow parser when available; otherwise large files are
+        parsed in chunks with the C engine to limit peak memory.
+        
+        Args:
+            filepath (str): Path to the CSV file
+            
+        Returns:
+            pandas.DataFrame: The loaded data
+        """
+        read_args = {
+            'usecols': REQUIRED_COLUMNS,
+            'dtype': COLUMN_DTYPES
+        }
+        
+        if _has_pyarrow():
+            return pd.read_csv(filepath, engine='pyarrow', **read_args)
+        
+        read_args['engine'] = 'c'
+        if os.path.getsize(filepath) <= CHUNKED_READ_THRESHOLD:
+            return pd.read_csv(filepath, **read_args)
+        
+        reader = pd.read_csv(filepath, chunksize=CHUNK_SIZE, **read_args)
+        return pd.concat(reader, ignore_index=True)
+    
+    def _validate_data(self, columns):
+        """
+        Validate that the data has the required columns.
+        
+        Args:
+            columns (Iterable[str]): Column names from the CSV header
+            
+        Returns:
+            bool: True if data is valid, False otherwise
+        """
         # Check if all required columns exist
-        missing_columns = [col for col in required_columns if col not in self.data.columns]
+        missing_columns = [col for col in REQUIRED_COLUMNS if col not in columns]
         
         if missing_columns:
-            print(f"Missing required columns: {', '.join(missing_columns)}")
+            logger.error("Missing required columns: %s", ', '.join(missing_columns))
             return False
         
         return True
@@ -88,43 +262,53 @@ class DataLoader:
     def _calculate_derived_values(self):
         """
         Calculate additional derived values from the raw data.
-        Converts date_recorded and time_recorded into a datetime and then into seconds.
+        Converts date_recorded and time_recorded into seconds since the first record.
         """
-        import pandas as pd
-        from datetime import datetime
-        
-        # Create a datetime column by combining date and time
         try:
             # Check if required columns exist
             if 'date_recorded' not in self.data.columns or 'time_recorded' not in self.data.columns:
-                print(f"Error: Missing date or time columns. Available columns: {self.data.columns.tolist()}")
+                logger.error("Missing date or time columns. Available columns: %s",
+                             self.data.columns.tolist())
                 return False
                 
-            # Combine date and time columns
-            self.data['datetime'] = pd.to_datetime(self.data['date_recorded'] + ' ' + self.data['time_recorded'])
+            # Combine date and time columns, parsing with the fixed log format.
+            # The timestamps are only needed to derive 'time' and are not stored.
+            timestamps = pd.to_datetime(
+                self.data['date_recorded'].str.cat(self.data['time_recorded'], sep=' '),
+                format=DATETIME_FORMAT,
+                cache=True
+            )
             
-            # Calculate seconds since start
-            start_time = self.data['datetime'].min()
-            self.data['time'] = (self.data['datetime'] - start_time).dt.total_seconds()
+            # Calculate seconds since start. Timestamps have whole-second
+            # resolution, which float32 holds exactly for runs up to ~194 days.
+            start_time = timestamps.min()
+            self.data['time'] = (timestamps - start_time).dt.total_seconds().astype(np.float32)
+            del timestamps
             
-            # Sort by time
-            self.data = self.data.sort_values('time')
+            # Sort by time, unless the log is already in chronological order
+            time_values = self.data['time'].to_numpy()
+            if not (np.diff(time_values) >= 0).all():
+                order = np.argsort(time_values, kind='stable')
+                
+                # Reset index after sorting
+                self.data = self.data.iloc[order].reset_index(drop=True)
             
-            # Reset index after sorting
-            self.data = self.data.reset_index(drop=True)
+            # Handle any NaN values, skipping the interpolation for clean data
+            numeric_columns = self.data.select_dtypes('number').columns
+            if any(np.isnan(self.data[col].to_numpy()).any() for col in numeric_columns):
+                self.data[numeric_columns] = self.data[numeric_columns].interpolate(method='linear')
+                self.data = self.data.dropna().reset_index(drop=True)
             
-            print(f"Data converted to time series. Time range: {self.data['time'].min()} to {self.data['time'].max()} seconds")
-            print(f"Data shape after processing: {self.data.shape}")
-            print(f"Columns after processing: {self.data.columns.tolist()}")
+            # Only scan the data for the summary when it will be logged
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Data converted to time series. Time range: %s to %s seconds",
+                             self.data['time'].min(), self.data['time'].max())
+                logger.debug("Data shape after processing: %s", self.data.shape)
+                logger.debug("Columns after processing: %s", self.data.columns.tolist())
             return True
         except Exception as e:
-            print(f"Error calculating time series: {e}")
+            logger.error("Error calculating time series: %s", e)
             return False
-        
-        # Handle any NaN values
-        if self.data.isna().any().any():
-            self.data = self.data.interpolate(method='linear')
-            self.data = self.data.dropna()
     
     def get_data(self):
         """
@@ -154,13 +338,35 @@ class DataLoader:
         if not self.is_loaded:
             return {}
         
+        if self._ranges is None:
+            self._ranges = self._calculate_ranges()
+        
         return {
             'filename': self.filename,
             'rows': len(self.data),
             'columns': self.get_column_names(),
-            'time_range': (self.data['time'].min(), self.data['time'].max()) if 'time' in self.data.columns else None,
-            'semi_major_axis_range': (self.data['semi_major_axis'].min(), self.data['semi_major_axis'].max()) if 'semi_major_axis' in self.data.columns else None,
-            'semi_minor_axis_range': (self.data['semi_minor_axis'].min(), self.data['semi_minor_axis'].max()) if 'semi_minor_axis' in self.data.columns else None,
-            'rotation_angle_range': (self.data['rotation_angle_deg'].min(), self.data['rotation_angle_deg'].max()) if 'rotation_angle_deg' in self.data.columns else None,
-            'eccentricity_range': (self.data['eccentricity'].min(), self.data['eccentricity'].max()) if 'eccentricity' in self.data.columns else None,
+            'time_range': self._ranges.get('time'),
+            'semi_major_axis_range': self._ranges.get('semi_major_axis'),
+            'semi_minor_axis_range': self._ranges.get('semi_minor_axis'),
+            'rotation_angle_range': self._ranges.get('rotation_angle_deg'),
+            'eccentricity_range': self._ranges.get('eccentricity'),
+        }
+    
+    def _calculate_ranges(self):
+        """
+        Calculate the (min, max) range of each summarized column in one pass.
+        
+        Returns:
+            dict: Column name to (min, max) tuple for the columns present in the data
+        """
+        columns = [col for col in SUMMARY_COLUMNS if col in self.data.columns]
+        if not columns or len(self.data) == 0:
+            return {col: (np.nan, np.nan) for col in columns}
+        
+        values = self.data[columns].to_numpy(dtype=np.float64)
+        mins = np.nanmin(values, axis=0)
+        maxs = np.nanmax(values, axis=0)
+        return {
+            col: (float(col_min), float(col_max))
+            for col, col_min, col_max in zip(columns, mins, maxs)
         }
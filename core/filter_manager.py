@@ -3,8 +3,22 @@ Filter manager for pendulum analysis.
 Handles data filtering based on IQR method for outlier removal.
 """
 
+import logging
+
 import numpy as np
-import pandas as pd
+
+# numexpr is optional; when installed the bound checks run in one fused pass
+try:
+    import numexpr
+    HAS_NUMEXPR = True
+except ImportError:
+    HAS_NUMEXPR = False
+
+logger = logging.getLogger(__name__)
+
+
+# Axes that support outlier filtering
+FILTER_AXES = ('semi_major_axis', 'semi_minor_axis')
 
 
 class FilterManager:
@@ -16,6 +30,15 @@ class FilterManager:
     def __init__(self):
         """Initialize the filter manager."""
         self.original_data = None
+        # Raw NumPy arrays of the filterable columns, cached per data set
+        self._axis_arrays = {}
+        # Preallocated mask and comparison buffers, reused on every re-filter
+        self._mask_buf = None
+        self._cmp_buf = None
+        # Last computed filter mask, keyed by the settings that produced it
+        self._cache_key = None
+        self._cache_mask = None
+        self._cache_data = None
         self.filter_settings = {
             'semi_major_axis': {
                 'enabled': False,
@@ -36,11 +59,20 @@ class FilterManager:
     def set_data(self, data):
         """
         Set the data and calculate IQR bounds.
+        The data is referenced, not copied, and must not be modified afterwards.
         
         Args:
             data (pandas.DataFrame): The original data
         """
-        self.original_data = data.copy()
+        self.original_data = data
+        self._axis_arrays = {
+            axis: self.original_data[axis].to_numpy()
+            for axis in FILTER_AXES
+            if axis in self.original_data.columns
+        }
+        self._mask_buf = np.empty(len(self.original_data), dtype=bool)
+        self._cmp_buf = np.empty(len(self.original_data), dtype=bool)
+        self._invalidate_cache()
         self._calculate_iqr_bounds()
     
     def _calculate_iqr_bounds(self):
@@ -48,26 +80,30 @@ class FilterManager:
         if self.original_data is None:
             return
         
-        for axis in ['semi_major_axis', 'semi_minor_axis']:
-            if axis in self.original_data.columns:
-                # Calculate quartiles
-                q1 = self.original_data[axis].quantile(0.25)
-                q3 = self.original_data[axis].quantile(0.75)
-                iqr = q3 - q1
-                
-                # Calculate bounds using 1.5 * IQR rule
-                iqr_min = q1 - 1.5 * iqr
-                iqr_max = q3 + 1.5 * iqr
-                
-                # Store IQR bounds
-                self.filter_settings[axis]['iqr_min'] = iqr_min
-                self.filter_settings[axis]['iqr_max'] = iqr_max
-                
-                # Set initial filter bounds to IQR bounds
-                self.filter_settings[axis]['min'] = iqr_min
-                self.filter_settings[axis]['max'] = iqr_max
-                
-                print(f"{axis} IQR bounds: [{iqr_min:.2f}, {iqr_max:.2f}]")
+        for axis, values in self._axis_arrays.items():
+            # Calculate both quartiles in a single pass, ignoring NaNs if present.
+            # Without any values the quartiles (and so the bounds) are NaN.
+            nan_mask = np.isnan(values)
+            if nan_mask.all():
+                q1 = q3 = float('nan')
+            else:
+                quantile = np.nanquantile if nan_mask.any() else np.quantile
+                q1, q3 = (float(q) for q in quantile(values, [0.25, 0.75]))
+            iqr = q3 - q1
+            
+            # Calculate bounds using 1.5 * IQR rule
+            iqr_min = q1 - 1.5 * iqr
+            iqr_max = q3 + 1.5 * iqr
+            
+            # Store IQR bounds
+            self.filter_settings[axis]['iqr_min'] = iqr_min
+            self.filter_settings[axis]['iqr_max'] = iqr_max
+            
+            # Set initial filter bounds to IQR bounds
+            self.filter_settings[axis]['min'] = iqr_min
+            self.filter_settings[axis]['max'] = iqr_max
+            
+            logger.debug("%s IQR bounds: [%.2f, %.2f]", axis, iqr_min, iqr_max)
     
     def set_filter_enabled(self, axis, enabled):
         """
@@ -79,7 +115,7 @@ class FilterManager:
         """
         if axis in self.filter_settings:
             self.filter_settings[axis]['enabled'] = enabled
-            print(f"Filter for {axis}: {'enabled' if enabled else 'disabled'}")
+            logger.debug("Filter for %s: %s", axis, 'enabled' if enabled else 'disabled')
     
     def set_filter_bounds(self, axis, min_val=None, max_val=None):
         """
@@ -95,7 +131,8 @@ class FilterManager:
                 self.filter_settings[axis]['min'] = min_val
             if max_val is not None:
                 self.filter_settings[axis]['max'] = max_val
-            print(f"Updated {axis} bounds: min={self.filter_settings[axis]['min']:.2f}, max={self.filter_settings[axis]['max']:.2f}")
+            logger.debug("Updated %s bounds: min=%s, max=%s", axis,
+                         self.filter_settings[axis]['min'], self.filter_settings[axis]['max'])
     
     def get_filter_settings(self):
         """
@@ -106,56 +143,173 @@ class FilterManager:
         """
         return self.filter_settings.copy()
     
-    def get_filtered_data(self):
+    def _settings_key(self):
         """
-        Get the filtered data based on current settings.
+        Build a hashable key describing the settings that affect filtering.
         
         Returns:
-            pandas.DataFrame: Filtered data
+            tuple: (axis, enabled, min, max) for each filterable axis
         """
-        if self.original_data is None:
-            return None
+        return tuple(
+            (axis, self.filter_settings[axis]['enabled'],
+             self.filter_settings[axis]['min'], self.filter_settings[axis]['max'])
+            for axis in FILTER_AXES
+        )
+    
+    def _any_filter_enabled(self):
+        """
+        Check whether any axis filter is enabled.
         
-        # Start with all data
-        filtered_data = self.original_data.copy()
-        mask = pd.Series([True] * len(filtered_data))
+        Returns:
+            bool: True if at least one filter is enabled
+        """
+        return any(self.filter_settings[axis]['enabled'] for axis in FILTER_AXES)
+    
+    def _invalidate_cache(self):
+        """Discard the cached filter mask and filtered data."""
+        self._cache_key = None
+        self._cache_mask = None
+        self._cache_data = None
+    
+    def _get_mask(self):
+        """
+        Get the boolean mask of points passing the current filters.
+        The mask is recomputed only when the filter settings change.
         
-        # Apply filters for each axis
-        for axis in ['semi_major_axis', 'semi_minor_axis']:
+        Returns:
+            numpy.ndarray: Boolean mask over the original data
+        """
+        key = self._settings_key()
+        if key == self._cache_key:
+            return self._cache_mask
+        
+        # Collect the bounds of each enabled axis filter
+        bounds = []
+        for axis in FILTER_AXES:
             if (self.filter_settings[axis]['enabled'] and 
-                axis in filtered_data.columns):
+                axis in self._axis_arrays):
                 
+                values = self._axis_arrays[axis]
                 min_val = self.filter_settings[axis]['min']
                 max_val = self.filter_settings[axis]['max']
                 
-                if min_val is not None or max_val is not None:
-                    # Create mask for this axis
-                    if min_val is not None and max_val is not None:
-                        # Check for invalid range
-                        if min_val > max_val:
-                            print(f"WARNING: {axis} has min ({min_val:.2f}) > max ({max_val:.2f}) - this will filter out all data!")
-                        axis_mask = (filtered_data[axis] >= min_val) & (filtered_data[axis] <= max_val)
-                    elif min_val is not None:
-                        axis_mask = filtered_data[axis] >= min_val
-                    else:  # max_val is not None
-                        axis_mask = filtered_data[axis] <= max_val
-                    # Combine with overall mask using AND (point must pass both filters)
-                    mask = mask & axis_mask
-                    
-                    # Debug: print how many points pass this filter
-                    points_passing = axis_mask.sum()
-                    print(f"  {axis}: {points_passing} points pass filter")
+                if min_val is not None and max_val is not None and min_val > max_val:
+                    # Check for invalid range
+                    logger.warning("%s has min (%.2f) > max (%.2f) - this will filter out all data!",
+                                   axis, min_val, max_val)
+                
+                # Compare in the column's own precision so both mask paths agree
+                scalar = values.dtype.type
+                bounds.append((
+                    values,
+                    scalar(min_val) if min_val is not None else None,
+                    scalar(max_val) if max_val is not None else None
+                ))
         
-        # Apply the combined mask
-        filtered_data = filtered_data[mask].copy()
+        if HAS_NUMEXPR:
+            mask = self._fused_mask(bounds)
+        else:
+            mask = self._numpy_mask(bounds)
         
-        # Print filtering statistics
-        original_count = len(self.original_data)
-        filtered_count = len(filtered_data)
-        removed_count = original_count - filtered_count
+        self._cache_key = key
+        self._cache_mask = mask
+        self._cache_data = None
+        return mask
+    
+    def _fused_mask(self, bounds):
+        """
+        Evaluate all bound checks in a single numexpr pass.
+        
+        Args:
+            bounds (list): (values, min, max) for each enabled axis
+            
+        Returns:
+            numpy.ndarray: Boolean mask over the original data
+        """
+        terms = []
+        local_dict = {}
+        for i, (values, min_val, max_val) in enumerate(bounds):
+            local_dict[f'v{i}'] = values
+            if min_val is not None:
+                terms.append(f'(v{i} >= lo{i})')
+                local_dict[f'lo{i}'] = min_val
+            if max_val is not None:
+                terms.append(f'(v{i} <= hi{i})')
+                local_dict[f'hi{i}'] = max_val
+        
+        mask = self._mask_buf
+        if not terms:
+            mask.fill(True)
+            return mask
+        
+        numexpr.evaluate(' & '.join(terms), local_dict=local_dict, out=mask)
+        return mask
+    
+    def _numpy_mask(self, bounds):
+        """
+        Combine the bound checks with NumPy ufuncs into the mask buffer.
+        
+        Args:
+            bounds (list): (values, min, max) for each enabled axis
+            
+        Returns:
+            numpy.ndarray: Boolean mask over the original data
+        """
+        mask = self._mask_buf
+        compare = self._cmp_buf
+        
+        checks = []
+        for values, min_val, max_val in bounds:
+            if min_val is not None:
+                checks.append((np.greater_equal, values, min_val))
+            if max_val is not None:
+                checks.append((np.less_equal, values, max_val))
+        
+        if not checks:
+            # Start with all data
+            mask.fill(True)
+            return mask
+        
+        # The first check writes the mask directly, saving a fill and an AND pass
+        op, values, bound = checks[0]
+        op(values, bound, out=mask)
+        
+        # Combine with overall mask using AND (point must pass both filters)
+        for op, values, bound in checks[1:]:
+            op(values, bound, out=compare)
+            np.logical_and(mask, compare, out=mask)
+        
+        return mask
+    
+    def get_filtered_data(self):
+        """
+        Get the filtered data based on current settings.
+        
+        Returns:
+            pandas.DataFrame: Filtered data
+        """
+        if self.original_data is None:
+            return None
+        
+        # Nothing to filter: hand back the data unchanged
+        if not self._any_filter_enabled():
+            return self.original_data
+        
+        mask = self._get_mask()
+        if self._cache_data is not None:
+            return self._cache_data
+        
+        # Apply the combined mask
+        filtered_data = self.original_data.iloc[mask]
+        self._cache_data = filtered_data
         
-        if removed_count > 0:
-            print(f"Filtering removed {removed_count} of {original_count} points ({removed_count/original_count*100:.1f}%)")
+        # Log filtering statistics
+        if logger.isEnabledFor(logging.DEBUG):
+            original_count = len(self.original_data)
+            removed_count = original_count - len(filtered_data)
+            if removed_count > 0:
+                logger.debug("Filtering removed %d of %d points (%.1f%%)",
+                             removed_count, original_count, removed_count / original_count * 100)
         
         return filtered_data
     
@@ -174,9 +328,11 @@ class FilterManager:
                 'removed_percentage': 0.0
             }
         
-        filtered_data = self.get_filtered_data()
         original_count = len(self.original_data)
-        filtered_count = len(filtered_data)
+        if self._any_filter_enabled():
+            filtered_count = int(np.count_nonzero(self._get_mask()))
+        else:
+            filtered_count = original_count
         removed_count = original_count - filtered_count
         
         return {
@@ -4,6 +4,7 @@ Manages the display and configuration of various plot types.
 """
 
 from utils.config import Config
+from utils.plot_helpers import fix_bottom_axis_ticks
 
 
 class PlotManager:
@@ -13,31 +14,62 @@ class PlotManager:
     
     def __init__(self):
         """Initialize the plot manager."""
-        # Initialize plot states (enabled/disabled) based on defaults
-        self.plot_states = {}
-        for plot_id, plot_info in Config.PLOT_TYPES.items():
-            self.plot_states[plot_id] = plot_info['enabled_by_default']
+        # Initialize plot states (enabled/disabled) based on defaults.
+        # Each plot type owns one bit of the state mask, in Config order.
+        self._plot_bits = {
+            plot_id: 1 << index for index, plot_id in enumerate(Config.PLOT_TYPES)
+        }
+        self._state_mask = 0
+        for plot_id, plot_type in Config.PLOT_TYPE_ITEMS:
+            if plot_type.enabled_by_default:
+                self._state_mask |= self._plot_bits[plot_id]
+        
+        # Result of get_available_plots, rebuilt when the enabled states change
+        self._available_cache = None
         
         # Initialize axis limits
         self.axis_limits = dict(Config.DEFAULT_AXIS_LIMITS)
         
         # Store references to created plot instances
         self.plots = {}
+        
+        # Enabled plot ids of the current figure layout, and the axes of
+        # each shown plot, reused across layout changes
+        self._layout_signature = None
+        self._axes_pool = {}
+    
+    @property
+    def plot_states(self):
+        """
+        Get the enabled state of every plot type.
+        
+        Returns:
+            dict: Dictionary of plot IDs and their enabled state
+        """
+        return {
+            plot_id: bool(self._state_mask & bit)
+            for plot_id, bit in self._plot_bits.items()
+        }
     
     def get_available_plots(self):
         """
         Get information about all available plot types.
+        The result is cached until an enabled state changes and must not be modified.
         
         Returns:
             dict: Dictionary of plot types with their information and current enabled state
         """
-        result = {}
-        for plot_id, plot_info in Config.PLOT_TYPES.items():
-            result[plot_id] = {
-                **plot_info,
-                'enabled': self.plot_states.get(plot_id, False)
+        if self._available_cache is None:
+            self._available_cache = {
+                plot_id: {
+                    'name': plot_type.name,
+                    'description': plot_type.description,
+                    'enabled_by_default': plot_type.enabled_by_default,
+                    'enabled': self.is_plot_enabled(plot_id)
+                }
+                for plot_id, plot_type in Config.PLOT_TYPE_ITEMS
             }
-        return result
+        return self._available_cache
     
     def set_plot_enabled(self, plot_id, enabled):
         """
@@ -50,10 +82,14 @@ class PlotManager:
         Returns:
             bool: True if successful, False otherwise
         """
-        if plot_id not in Config.PLOT_TYPES:
+        bit = self._plot_bits.get(plot_id)
+        if bit is None:
             return False
         
-        self.plot_states[plot_id] = enabled
+        state_mask = self._state_mask | bit if enabled else self._state_mask & ~bit
+        if state_mask != self._state_mask:
+            self._state_mask = state_mask
+            self._available_cache = None
         return True
     
     def is_plot_enabled(self, plot_id):
@@ -66,7 +102,8 @@ class PlotManager:
         Returns:
             bool: True if the plot is enabled, False otherwise
         """
-        return self.plot_states.get(plot_id, False)
+        bit = self._plot_bits.get(plot_id)
+        return bit is not None and bool(self._state_mask & bit)
     
     def set_axis_limits(self, x_min=None, x_max=None, y_min=None, y_max=None):
         """
@@ -90,9 +127,11 @@ class PlotManager:
         if y_max is not None:
             self.axis_limits['y_max'] = y_max
         
-        # Update any existing plots
+        # Update any existing plots, then redraw the figure once for all of them
         for plot in self.plots.values():
-            plot.update_axis_limits(self.axis_limits)
+            plot.update_axis_limits(self.axis_limits, defer_draw=True)
+        if self.plots:
+            next(iter(self.plots.values())).ax.figure.canvas.draw_idle()
         
         return self.axis_limits
     
@@ -105,77 +144,153 @@ class PlotManager:
         """
         return dict(self.axis_limits)
     
-    def create_plots(self, data, figure):
+    def create_plots(self, data, figure, on_plot_created=None):
         """
         Create all enabled plots for the given data.
+        Axes are kept in a pool keyed by plot ID: plots that stay enabled keep
+        their axes and artists and only have their data refreshed, while
+        toggled plots are added or removed and the rest are moved into place.
         
         Args:
             data (pandas.DataFrame): The data to plot
             figure (matplotlib.figure.Figure): Figure to draw the plots on
+            on_plot_created (callable, optional): Called without arguments after
+                each new plot is initialized, e.g. to keep a GUI responsive
             
         Returns:
             list: List of created plot objects and the list of axes
         """
         # Import the plot classes here to avoid circular imports
         from plots.time_series_plot import TimeSeriesPlot
-        import matplotlib.pyplot as plt
-        
-        # Clear existing plots
-        self.plots = {}
-        figure.clear()
+        from matplotlib.gridspec import GridSpec
         
         # Calculate subplot grid based on number of enabled plots
-        enabled_plots = [plot_id for plot_id, enabled in self.plot_states.items() if enabled]
+        enabled_plots = [plot_id for plot_id, bit in self._plot_bits.items() if self._state_mask & bit]
         num_plots = len(enabled_plots)
         
+        # Forget pooled axes that are no longer on this figure (e.g. after figure.clear())
+        for plot_id, ax in list(self._axes_pool.items()):
+            if ax not in figure.axes:
+                self._teardown_plot(plot_id)
+        
+        # Same plots on the same figure: only refresh the data
+        signature = tuple(enabled_plots)
+        if signature == self._layout_signature and len(self._axes_pool) == num_plots:
+            self.update_plot_data(data)
+            return list(self.plots.values()), self._ordered_axes(enabled_plots)
+        
+        self._layout_signature = signature
+        
+        # Remove only the axes of plots that were disabled
+        for plot_id in [plot_id for plot_id in self._axes_pool if plot_id not in enabled_plots]:
+            self._teardown_plot(plot_id)
+        
         if num_plots == 0:
             # No plots to display
             return [], []
         
         # Always use vertical stacking: num_plots rows, 1 column
-        rows, cols = num_plots, 1
-        
-        # Create each enabled plot
-        created_plots = []
-        all_axes = []  # Keep track of all axes for synchronization
-        
-        # Create all plots with shared x-axis
-        sharex = None  # First axis to share with
+        if self._axes_pool:
+            # Move kept axes into a new grid; new axes share their x-axis with them
+            grid = GridSpec(num_plots, 1, figure=figure)
+            sharex = next(iter(self._axes_pool.values()))
+            new_axes = None
+        else:
+            # Nothing to reuse: create every axes in one batched call
+            new_axes = iter(figure.subplots(num_plots, 1, sharex=True, squeeze=False)[:, 0])
         
         for plot_idx, plot_id in enumerate(enabled_plots):
-            # Create subplot 
-            if plot_idx == 0:
-                ax = figure.add_subplot(rows, cols, plot_idx + 1)
-                sharex = ax  # Save first axes for sharing
+            ax = self._axes_pool.get(plot_id)
+            if ax is not None:
+                # Kept plot: move it to its new slot and refresh its data
+                ax.set_subplotspec(grid[plot_idx])
+                self.plots[plot_id].set_data(data)
             else:
-                ax = figure.add_subplot(rows, cols, plot_idx + 1, sharex=sharex)
-            
-            all_axes.append(ax)
-            
-            # Remove title
-            ax.set_title('')
-            
-            # Configure x-axis visibility
-            if plot_idx < num_plots - 1:  # Not the bottom plot
-                # Hide x-axis tick labels on non-bottom plots
-                plt.setp(ax.get_xticklabels(), visible=False)
-                ax.set_xlabel('')
-            else:  # This is the bottom plot
-                # Show the x label
-                ax.set_xlabel("Time (seconds)")
-            
-            # Create the plot
-            plot = TimeSeriesPlot(data, ax, parameter=plot_id)
-            self.plots[plot_id] = plot
-            created_plots.append(plot)
+                if new_axes is not None:
+                    ax = next(new_axes)
+                else:
+                    ax = figure.add_subplot(grid[plot_idx], sharex=sharex)
+                self._axes_pool[plot_id] = ax
+                
+                # Remove title
+                ax.set_title('')
+                
+                # Shared axes only notify the axes whose limits were set, so
+                # every axes reports zooms and pans to all plots
+                ax.callbacks.connect('xlim_changed', self._on_xlim_changed)
+                
+                # Create and initialize the plot
+                plot = TimeSeriesPlot(data, ax, parameter=plot_id)
+                self.plots[plot_id] = plot
+                plot.initialize()
+                
+                if on_plot_created is not None:
+                    on_plot_created()
+        
+        # Keep the plots in display order
+        self.plots = {plot_id: self.plots[plot_id] for plot_id in enabled_plots}
+        all_axes = self._ordered_axes(enabled_plots)
+        
+        # Only the bottom plot shows the x tick labels and label
+        fix_bottom_axis_ticks(all_axes)
+        
+        # Spacing is handled by the figure's layout engine (see PlotPanel)
+        return list(self.plots.values()), all_axes
+    
+    def update_plot_data(self, data):
+        """
+        Push new data into the existing plots, keeping their axes and artists.
+        
+        Args:
+            data (pandas.DataFrame): The data to plot
             
-            # Initialize the plot
-            plot.initialize()
+        Returns:
+            bool: True if any plots were updated, False otherwise
+        """
+        if not self.plots:
+            return False
         
-        # Tighten the layout
-        figure.subplots_adjust(hspace=0.0)
+        for plot in self.plots.values():
+            plot.set_data(data)
+        return True
+    
+    def _on_xlim_changed(self, ax):
+        """
+        Show the data of every plot in detail for the new visible x-range.
         
-        return created_plots, all_axes
+        Args:
+            ax (matplotlib.axes.Axes): The axes whose x-limits changed
+        """
+        x_min, x_max = ax.get_xlim()
+        for plot in self.plots.values():
+            plot.set_x_view(x_min, x_max)
+    
+    def _teardown_plot(self, plot_id):
+        """
+        Remove a plot and its axes, breaking the references between them.
+        
+        Args:
+            plot_id (str): ID of the plot to remove
+        """
+        ax = self._axes_pool.pop(plot_id, None)
+        if ax is not None and ax.figure is not None and ax in ax.figure.axes:
+            ax.remove()
+        
+        plot = self.plots.pop(plot_id, None)
+        if plot is not None:
+            plot.teardown()
+    
+    def _ordered_axes(self, plot_ids):
+        """
+        Get the pooled axes of the given plots, in the given order.
+        
+        Args:
+            plot_ids (list): IDs of the plots
+            
+        Returns:
+            list: The axes of the plots
+        """
+        return [self._axes_pool[plot_id] for plot_id in plot_ids]
     
     def update_plots(self):
         """
@@ -7,8 +7,13 @@ viewing various plots of the data, and performing analysis on the data.
 """
 
 import sys
+
+# Select the Qt backend before anything imports matplotlib, so it never has
+# to probe for one
+import matplotlib
+matplotlib.use('Qt5Agg')
+
 from PyQt5.QtWidgets import QApplication
-from ui.main_window import MainWindow
 
 
 def main():
@@ -20,7 +25,9 @@ def main():
     # Set application style
     app.setStyle("Fusion")
     
-    # Create and show the main window
+    # Create and show the main window. The UI (and with it matplotlib's
+    # plotting modules) is imported only once the application exists.
+    from ui.main_window import MainWindow
     window = MainWindow()
     window.show()
     
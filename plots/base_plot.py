@@ -2,8 +2,6 @@
 Base class for all plot types in the pendulum data analysis application.
 """
 
-import matplotlib.pyplot as plt
-
 
 class BasePlot:
     """
@@ -25,6 +23,9 @@ class BasePlot:
         self.title = title
         self.is_initialized = False
         
+        # Canvas redraw method, resolved on the first update
+        self._draw = None
+        
         # Default axis limits (None means auto)
         self.axis_limits = {
             'x_min': None,
@@ -32,6 +33,8 @@ class BasePlot:
             'y_min': None,
             'y_max': None
         }
+        # Whether axis_limits have changed since they were last applied
+        self._limits_dirty = True
     
     def initialize(self):
         """
@@ -45,6 +48,46 @@ class BasePlot:
         self.is_initialized = True
         return True
     
+    def set_data(self, data):
+        """
+        Replace the plotted data, updating the existing artists in place.
+        
+        Args:
+            data (pandas.DataFrame): New data to plot
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        self.data = data
+        
+        if self.is_initialized:
+            self._update_artists()
+            # New data needs new limits
+            self._autoscale()
+        
+        return True
+    
+    def _update_artists(self):
+        """
+        Push the current data into the plot's artists.
+        This method should be overridden by subclasses.
+        """
+        pass
+    
+    def _autoscale(self):
+        """Rescale the axes to fit the current data."""
+        self.ax.relim()
+        self._autoscale_view()
+    
+    def _autoscale_view(self):
+        """
+        Fit the view to the current data limits, then switch autoscaling off
+        so later draws do not recompute the limits.
+        """
+        self.ax.set_autoscale_on(True)
+        self.ax.autoscale_view()
+        self.ax.set_autoscale_on(False)
+    
     def update(self):
         """
         Update the plot with the current data.
@@ -56,32 +99,45 @@ class BasePlot:
         if not self.is_initialized:
             self.initialize()
         
-        # Apply axis limits
-        self._apply_axis_limits()
+        # Apply axis limits if they changed
+        if self._limits_dirty:
+            self._apply_axis_limits()
         
         # Redraw the plot
-        if hasattr(self.ax.figure.canvas, 'draw_idle'):
-            self.ax.figure.canvas.draw_idle()
+        self._request_draw()
         
         return True
     
-    def update_axis_limits(self, limits):
+    def _request_draw(self):
+        """Ask the canvas for a redraw of the whole figure."""
+        if self._draw is None:
+            canvas = self.ax.figure.canvas
+            self._draw = getattr(canvas, 'draw_idle', canvas.draw)
+        self._draw()
+    
+    def update_axis_limits(self, limits, defer_draw=False):
         """
         Update the axis limits for this plot.
         
         Args:
             limits (dict): Dictionary containing x_min, x_max, y_min, y_max
+            defer_draw (bool, optional): Leave redrawing to the caller, e.g. to
+                draw once after updating several plots
             
         Returns:
             bool: True if successful, False otherwise
         """
         # Update only the provided limits
         for key in ['x_min', 'x_max', 'y_min', 'y_max']:
-            if key in limits and limits[key] is not None:
+            if key in limits and limits[key] is not None and limits[key] != self.axis_limits[key]:
                 self.axis_limits[key] = limits[key]
+                self._limits_dirty = True
         
         # Apply the new limits
-        self._apply_axis_limits()
+        if self._limits_dirty:
+            self._apply_axis_limits()
+            if not defer_draw:
+                self._request_draw()
         
         return True
     
@@ -89,9 +145,14 @@ class BasePlot:
         """
         Apply the current axis limits to the plot.
         """
+        self._limits_dirty = False
         if self.ax is None:
             return
         
+        # Nothing to apply when every limit is automatic
+        if all(value is None for value in self.axis_limits.values()):
+            return
+        
         # Get current limits for any that are set to auto (None)
         x_min, x_max = self.ax.get_xlim()
         y_min, y_max = self.ax.get_ylim()
@@ -107,6 +168,17 @@ class BasePlot:
             self.axis_limits['y_max'] if self.axis_limits['y_max'] is not None else y_max
         )
     
+    def teardown(self):
+        """
+        Drop the references to the axes, data and cached drawing state once
+        the plot is no longer shown, so they can be freed without waiting
+        for the garbage collector.
+        """
+        self.ax = None
+        self.data = None
+        self._draw = None
+        self.is_initialized = False
+    
     def clear(self):
         """
         Clear the plot.
@@ -3,10 +3,30 @@ Position plot for pendulum analysis.
 Displays an X-Y scatter plot of pendulum position.
 """
 
+from functools import lru_cache
+
 import numpy as np
 from plots.base_plot import BasePlot
 
 
+@lru_cache(maxsize=8)
+def _column_map(columns):
+    """
+    Map lower-cased column names to the original names.
+    Cached per column set, so plots of the same data share one map.
+    
+    Args:
+        columns (tuple): Column names of the data
+        
+    Returns:
+        dict: Lower-cased name to original name (first column wins on clashes)
+    """
+    column_map = {}
+    for col in columns:
+        column_map.setdefault(col.lower(), col)
+    return column_map
+
+
 class PositionPlot(BasePlot):
     """
     Position plot showing X-Y coordinates of the pendulum.
@@ -24,6 +44,14 @@ class PositionPlot(BasePlot):
         
         # Store plot elements
         self.scatter = None
+        self._cbar = None
+        
+        # Scatter offsets and color index arrays, rebuilt only when the data changes
+        self._arrays_data = None
+        self._offsets = None
+        self._time_idx = None
+        # Data object last pushed into the scatter plot
+        self._artists_data = None
         
         # Find the appropriate column names
         self.x_col = self._find_column('x')
@@ -51,15 +79,17 @@ class PositionPlot(BasePlot):
             f"{dimension}_position"
         ]
         
-        # Check if any of the possible names exist in the data
+        column_map = _column_map(tuple(self.data.columns))
+        
+        # Check if any of the possible names exist in the data, ignoring case
         for name in possible_names:
-            if name in self.data.columns:
-                return name
+            col = column_map.get(name)
+            if col is not None:
+                return col
                 
-        # If no exact match, try case-insensitive matching
-        for col in self.data.columns:
-            col_lower = col.lower()
-            if any(name.lower() in col_lower for name in possible_names):
+        # If no exact match, try substring matching
+        for col_lower, col in column_map.items():
+            if any(name in col_lower for name in possible_names):
                 return col
                 
         return None
@@ -82,23 +112,34 @@ class PositionPlot(BasePlot):
         self.ax.set_title("Pendulum Position")
         self.ax.grid(True)
         
-        # Create the scatter plot
-        self.scatter = self.ax.scatter(
-            self.data[self.x_col],
-            self.data[self.y_col],
-            s=10,  # Marker size
-            c=np.arange(len(self.data)),  # Color by time
-            cmap='viridis',
-            alpha=0.7
-        )
-        
-        # Add a colorbar as a time indicator
-        cbar = self.ax.figure.colorbar(self.scatter, ax=self.ax)
-        cbar.set_label('Time Index')
+        if self.scatter is None:
+            # Create the scatter plot
+            offsets, time_idx = self._get_arrays()
+            self.scatter = self.ax.scatter(
+                offsets[:, 0],
+                offsets[:, 1],
+                s=10,  # Marker size
+                c=time_idx,  # Color by time
+                cmap='viridis',
+                alpha=0.7
+            )
+            self._artists_data = self.data
+            
+            # Add a colorbar as a time indicator
+            self._cbar = self.ax.figure.colorbar(self.scatter, ax=self.ax)
+            self._cbar.set_label('Time Index')
+        else:
+            # Reinitializing: reuse the scatter plot and its colorbar rather
+            # than stacking another colorbar next to the axes
+            self._update_artists()
+            self._cbar.update_normal(self.scatter)
         
         # Set aspect ratio to equal for true representation of distances
         self.ax.set_aspect('equal')
         
+        # Fit the initial view, then keep it until a rescale is requested
+        self._autoscale_view()
+        
         self.is_initialized = True
         return True
     
@@ -115,16 +156,75 @@ class PositionPlot(BasePlot):
                 return False
         
         # Update the scatter plot with new data
-        if self.scatter is not None:
-            self.scatter.set_offsets(np.column_stack([
-                self.data[self.x_col],
-                self.data[self.y_col]
-            ]))
-            
-            # Update the color mapping for time
-            self.scatter.set_array(np.arange(len(self.data)))
+        self._update_artists()
         
         # Apply axis limits and refresh
         super().update()
         
         return True
+    
+    def _update_artists(self):
+        """Push the current data into the scatter plot, if it has changed."""
+        if self.scatter is None or self._artists_data is self.data:
+            return
+        
+        offsets, time_idx = self._get_arrays()
+        self.scatter.set_offsets(offsets)
+        
+        # The color mapping for time only depends on the number of points
+        if len(self.scatter.get_array()) != len(time_idx):
+            self.scatter.set_array(time_idx)
+        self._artists_data = self.data
+    
+    def _get_arrays(self):
+        """
+        Get the scatter offsets and time index of the current data.
+        The arrays are cached and only refilled when the data object changes;
+        the buffers are reallocated only when its length changes.
+        
+        Returns:
+            tuple: (N, 2) array of x/y positions and the time index array
+        """
+        if self._arrays_data is not self.data:
+            n = len(self.data)
+            if self._offsets is None or len(self._offsets) != n:
+                self._offsets = np.empty((n, 2))
+                self._time_idx = np.arange(n)
+            np.stack([
+                self.data[self.x_col].to_numpy(),
+                self.data[self.y_col].to_numpy()
+            ], axis=1, out=self._offsets)
+            self._arrays_data = self.data
+        return self._offsets, self._time_idx
+    
+    def _autoscale(self):
+        """Rescale the axes to fit the scatter points."""
+        # relim() ignores collections, so add the scatter offsets explicitly
+        self.ax.relim()
+        if self.scatter is not None:
+            self.ax.update_datalim(self.scatter.get_offsets())
+        self._autoscale_view()
+    
+    def teardown(self):
+        """Drop the references to the scatter plot, colorbar and cached arrays as well."""
+        super().teardown()
+        self.scatter = None
+        self._cbar = None
+        self._arrays_data = None
+        self._artists_data = None
+        self._offsets = None
+        self._time_idx = None
+    
+    def clear(self):
+        """
+        Clear the plot, removing its colorbar.
+        
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        if self._cbar is not None:
+            self._cbar.remove()
+            self._cbar = None
+        self.scatter = None
+        self._artists_data = None
+        return super().clear()
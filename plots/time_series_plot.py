@@ -3,7 +3,13 @@ Time series plot for pendulum analysis.
 Displays a time series of pendulum parameters over time.
 """
 
+import logging
+
 from plots.base_plot import BasePlot
+from utils.config import Config
+from utils.plot_helpers import downsample_lttb
+
+logger = logging.getLogger(__name__)
 
 
 class TimeSeriesPlot(BasePlot):
@@ -25,8 +31,20 @@ class TimeSeriesPlot(BasePlot):
         
         # Store plot elements
         self.line = None
-        self.markers = None
         self.parameter = parameter
+        
+        # NumPy views of the time and parameter columns, cached per data object
+        self._columns_data = None
+        self._t_all = None
+        self._y_all = None
+        
+        # Visible x-range (None for the whole data), and the values to plot
+        # for it, cached per data object, point budget and visible slice
+        self._x_view = None
+        self._arrays_data = None
+        self._arrays_key = None
+        self._t = None
+        self._y = None
     
     def initialize(self):
         """
@@ -37,20 +55,16 @@ class TimeSeriesPlot(BasePlot):
         """
         # Make sure the parameter exists in the data
         if self.parameter not in self.data.columns:
-            print(f"Error: Parameter '{self.parameter}' not found in the data")
+            logger.error("Parameter '%s' not found in the data", self.parameter)
             return False
         
         # Check for time column
         if 'time' not in self.data.columns:
-            print(f"Error: 'time' column not found in the data")
-            print(f"Available columns: {self.data.columns.tolist()}")
+            logger.error("'time' column not found in the data. Available columns: %s",
+                         self.data.columns.tolist())
             return False
             
-        # Print some debug info
-        print(f"Initializing plot for '{self.parameter}'")
-        print(f"Data has {len(self.data)} rows")
-        print(f"Time range: {self.data['time'].min()} to {self.data['time'].max()}")
-        print(f"{self.parameter} range: {self.data[self.parameter].min()} to {self.data[self.parameter].max()}")
+        logger.debug("Initializing plot for '%s' with %d rows", self.parameter, len(self.data))
         
         # We'll let plot_manager decide which plots show the x-axis label
         # Only the bottom plot will show it
@@ -68,33 +82,34 @@ class TimeSeriesPlot(BasePlot):
         # Don't set a title to keep plots compact
         self.ax.grid(True, alpha=0.3)  # Lighter grid for less visual noise
         
-        # Enable autoscaling for both axes
+        # Fit both axes tightly to the data whenever they are rescaled
         self.ax.autoscale(True, 'both', True)
         
         try:
-            # Create the line plot
+            t, y = self._get_arrays()
+            
+            # Create the line plot, with markers on the individual data
+            # points when there are few enough of them to be seen
             self.line, = self.ax.plot(
-                self.data['time'],
-                self.data[self.parameter],
-                'b-',  # Blue line
+                t,
+                y,
+                color='b',  # Blue line
+                marker=self._marker(),
+                markersize=4.5,
+                markerfacecolor='red',
+                markeredgecolor='red',
                 linewidth=1.5,
                 alpha=0.8
             )
             
-            # Add markers to show individual data points
-            self.markers = self.ax.scatter(
-                self.data['time'],
-                self.data[self.parameter],
-                s=20,  # Marker size
-                color='red',
-                alpha=0.5
-            )
+            # Fit the initial view, then keep it until a rescale is requested
+            self._autoscale_view()
             
-            print(f"Plot for '{self.parameter}' created successfully")
+            logger.debug("Plot for '%s' created successfully", self.parameter)
             self.is_initialized = True
             return True
         except Exception as e:
-            print(f"Error creating plot for '{self.parameter}': {e}")
+            logger.error("Error creating plot for '%s': %s", self.parameter, e)
             return False
     
     def update(self):
@@ -109,15 +124,108 @@ class TimeSeriesPlot(BasePlot):
             if not self.initialize():
                 return False
         
-        # Update the line and markers with new data
-        if self.line is not None:
-            self.line.set_xdata(self.data['time'])
-            self.line.set_ydata(self.data[self.parameter])
-            
-        if self.markers is not None:
-            self.markers.set_offsets(list(zip(self.data['time'], self.data[self.parameter])))
+        # Update the line with new data
+        self._update_artists()
         
         # Apply axis limits and refresh
         super().update()
         
-        return True
\ No newline at end of file
+        return True
+    
+    def set_data(self, data):
+        """
+        Replace the plotted data, showing all of it.
+        
+        Args:
+            data (pandas.DataFrame): New data to plot
+            
+        Returns:
+            bool: True if successful, False otherwise
+        """
+        # The line holds the whole data set while the axes are rescaled to it
+        self._x_view = None
+        return super().set_data(data)
+    
+    def set_x_view(self, x_min, x_max):
+        """
+        Plot the data at full detail for the visible x-range, e.g. after a zoom or pan.
+        The axis limits are left unchanged.
+        
+        Args:
+            x_min (float): Left end of the visible range
+            x_max (float): Right end of the visible range
+        """
+        self._x_view = (x_min, x_max)
+        if self.line is None:
+            return
+        
+        # The line always shows the last arrays returned by _get_arrays
+        shown = self._t
+        t, y = self._get_arrays()
+        if t is not shown:
+            self.line.set_data(t, y)
+    
+    def _update_artists(self):
+        """Push the current data into the line."""
+        t, y = self._get_arrays()
+        
+        if self.line is not None:
+            self.line.set_data(t, y)
+            self.line.set_marker(self._marker())
+    
+    def _marker(self):
+        """
+        Get the marker style for the current data.
+        
+        Returns:
+            str: 'o' for small data sets, or 'None' to draw the line only
+        """
+        return 'o' if len(self.data) < Config.MARKER_POINT_LIMIT else 'None'
+    
+    def _get_arrays(self):
+        """
+        Get the time and parameter values to plot for the visible x-range,
+        downsampled to Config.PLOT_POINTS_PER_PIXEL points per pixel of the
+        axes width. A visible slice that fits the budget is plotted as is.
+        
+        Returns:
+            tuple: Time array and parameter array
+        """
+        if self._columns_data is not self.data:
+            self._t_all = self.data['time'].to_numpy()
+            self._y_all = self.data[self.parameter].to_numpy()
+            self._columns_data = self.data
+        t_all, y_all = self._t_all, self._y_all
+        
+        # Never downsample below the marker limit, so markers are only
+        # ever drawn on actual data points
+        n_points = max(int(self.ax.bbox.width * Config.PLOT_POINTS_PER_PIXEL),
+                       Config.MARKER_POINT_LIMIT)
+        
+        # Visible slice of the (time-sorted) data, with one point beyond
+        # either end so the line runs on past the edges of the axes
+        start, stop = 0, len(t_all)
+        if self._x_view is not None:
+            x_min, x_max = self._x_view
+            start = max(int(t_all.searchsorted(x_min, 'left')) - 1, 0)
+            stop = min(int(t_all.searchsorted(x_max, 'right')) + 1, len(t_all))
+        
+        key = (n_points, start, stop)
+        if self._arrays_data is not self.data or self._arrays_key != key:
+            self._t, self._y = downsample_lttb(t_all[start:stop], y_all[start:stop], n_points)
+            self._arrays_data = self.data
+            self._arrays_key = key
+        return self._t, self._y
+    
+    def teardown(self):
+        """Drop the references to the line and cached arrays as well."""
+        super().teardown()
+        self.line = None
+        self._columns_data = None
+        self._t_all = None
+        self._y_all = None
+        self._x_view = None
+        self._arrays_data = None
+        self._arrays_key = None
+        self._t = None
+        self._y = None
@@ -0,0 +1,153 @@
+"""
+Tests for the filter manager.
+"""
+
+import math
+import unittest
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from core import filter_manager as filter_module
+from core.filter_manager import FILTER_AXES, FilterManager
+
+
+class FilterManagerEmptyDataTest(unittest.TestCase):
+    """
+    IQR bounds of data without values for a filterable axis.
+    """
+    
+    def _assert_nan_bounds(self, settings):
+        """Check that all bounds of an axis are NaN."""
+        for key in ('min', 'max', 'iqr_min', 'iqr_max'):
+            self.assertTrue(math.isnan(settings[key]), key)
+    
+    def test_empty_data(self):
+        """Data without rows loads with NaN bounds."""
+        data = pd.DataFrame({
+            'semi_major_axis': np.array([], dtype=float),
+            'semi_minor_axis': np.array([], dtype=float)
+        })
+        filter_manager = FilterManager()
+        filter_manager.set_data(data)
+        
+        settings = filter_manager.get_filter_settings()
+        self._assert_nan_bounds(settings['semi_major_axis'])
+        self._assert_nan_bounds(settings['semi_minor_axis'])
+        self.assertEqual(len(filter_manager.get_filtered_data()), 0)
+    
+    def test_all_nan_column(self):
+        """A column of NaNs gets NaN bounds; the other column is unaffected."""
+        data = pd.DataFrame({
+            'semi_major_axis': [np.nan, np.nan, np.nan],
+            'semi_minor_axis': [1.0, 2.0, 3.0]
+        })
+        filter_manager = FilterManager()
+        filter_manager.set_data(data)
+        
+        settings = filter_manager.get_filter_settings()
+        self._assert_nan_bounds(settings['semi_major_axis'])
+        self.assertEqual(settings['semi_minor_axis']['iqr_min'], 0.0)
+        self.assertEqual(settings['semi_minor_axis']['iqr_max'], 4.0)
+
+
+class FilterManagerMaskTest(unittest.TestCase):
+    """
+    Filter masks of the numexpr and NumPy paths, and their memo.
+    """
+    
+    # Bounds per axis, exactly representable in float32
+    BOUNDS = {
+        'semi_major_axis': (0.25, 0.75),
+        'semi_minor_axis': (-0.5, 0.5)
+    }
+    
+    def setUp(self):
+        """Create random axis data with points on the bounds."""
+        rng = np.random.default_rng(0)
+        self.data = pd.DataFrame({
+            'time': np.arange(200, dtype=np.float32),
+            'semi_major_axis': rng.uniform(0.0, 1.0, 200).astype(np.float32),
+            'semi_minor_axis': rng.uniform(-1.0, 1.0, 200).astype(np.float32)
+        })
+        # Put values exactly on the bounds, which must pass the filter
+        for axis, (lo, hi) in self.BOUNDS.items():
+            self.data.loc[0, axis] = lo
+            self.data.loc[1, axis] = hi
+        self.filter_manager = FilterManager()
+        self.filter_manager.set_data(self.data)
+    
+    def _expected(self, axis):
+        """Filter the data for one axis with plain pandas comparisons."""
+        lo, hi = self.BOUNDS[axis]
+        col = self.data[axis]
+        return self.data[(col >= lo) & (col <= hi)]
+    
+    def _check_axes(self):
+        """Check the filtered data of each axis against pandas."""
+        for axis in FILTER_AXES:
+            with self.subTest(axis=axis):
+                filter_manager = FilterManager()
+                filter_manager.set_data(self.data)
+                filter_manager.set_filter_bounds(axis, *self.BOUNDS[axis])
+                filter_manager.set_filter_enabled(axis, True)
+                
+                expected = self._expected(axis)
+                self.assertGreater(len(expected), 0)
+                self.assertLess(len(expected), len(self.data))
+                pd.testing.assert_frame_equal(filter_manager.get_filtered_data(), expected)
+    
+    @unittest.skipUnless(filter_module.HAS_NUMEXPR, 'numexpr is not installed')
+    def test_numexpr_mask(self):
+        """The fused numexpr mask matches pandas for each axis."""
+        with mock.patch.object(FilterManager, '_numpy_mask', side_effect=AssertionError):
+            self._check_axes()
+    
+    def test_numpy_mask(self):
+        """The NumPy fallback mask matches pandas for each axis."""
+        with mock.patch.object(filter_module, 'HAS_NUMEXPR', False), \
+                mock.patch.object(FilterManager, '_fused_mask', side_effect=AssertionError):
+            self._check_axes()
+    
+    def test_both_axes(self):
+        """With both filters enabled, a point must pass both."""
+        for axis in FILTER_AXES:
+            self.filter_manager.set_filter_bounds(axis, *self.BOUNDS[axis])
+            self.filter_manager.set_filter_enabled(axis, True)
+        
+        major = self.data['semi_major_axis']
+        minor = self.data['semi_minor_axis']
+        expected = self.data[(major >= 0.25) & (major <= 0.75) &
+                             (minor >= -0.5) & (minor <= 0.5)]
+        pd.testing.assert_frame_equal(self.filter_manager.get_filtered_data(), expected)
+    
+    def test_memo_invalidated_by_settings(self):
+        """Changing a setting recomputes the mask; otherwise it is reused."""
+        axis = 'semi_major_axis'
+        self.filter_manager.set_filter_bounds(axis, *self.BOUNDS[axis])
+        self.filter_manager.set_filter_enabled(axis, True)
+        
+        first = self.filter_manager.get_filtered_data()
+        key = self.filter_manager._cache_key
+        self.assertIs(self.filter_manager.get_filtered_data(), first)
+        self.assertEqual(self.filter_manager._cache_key, key)
+        
+        # Narrowing the bounds replaces the memo
+        self.filter_manager.set_filter_bounds(axis, max_val=0.5)
+        narrowed = self.filter_manager.get_filtered_data()
+        self.assertNotEqual(self.filter_manager._cache_key, key)
+        col = self.data[axis]
+        pd.testing.assert_frame_equal(narrowed, self.data[(col >= 0.25) & (col <= 0.5)])
+        
+        # Enabling the other axis replaces it again
+        key = self.filter_manager._cache_key
+        self.filter_manager.set_filter_bounds('semi_minor_axis', *self.BOUNDS['semi_minor_axis'])
+        self.filter_manager.set_filter_enabled('semi_minor_axis', True)
+        both = self.filter_manager.get_filtered_data()
+        self.assertNotEqual(self.filter_manager._cache_key, key)
+        self.assertLess(len(both), len(narrowed))
+
+
+if __name__ == '__main__':
+    unittest.main()
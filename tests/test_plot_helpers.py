@@ -0,0 +1,66 @@
+"""
+Tests for the plot helpers.
+"""
+
+import unittest
+
+import numpy as np
+
+from utils.plot_helpers import downsample_lttb
+
+
+class DownsampleLttbTest(unittest.TestCase):
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+    """
+    
+    def setUp(self):
+        """Create a noisy sine series."""
+        rng = np.random.default_rng(0)
+        self.x = np.arange(10_000, dtype=np.float64)
+        self.y = np.sin(self.x / 500) + rng.normal(0, 0.01, len(self.x))
+    
+    def _check_shape(self, x_out, y_out, n_out):
+        """Check the length, kept end points and order of a result."""
+        self.assertEqual(len(x_out), n_out)
+        self.assertEqual(len(y_out), n_out)
+        self.assertEqual(x_out[0], self.x[0])
+        self.assertEqual(x_out[-1], self.x[-1])
+        self.assertTrue((np.diff(x_out) > 0).all())
+    
+    def test_output_shape(self):
+        """The result has n_out points, keeps both ends and stays in order."""
+        for n_out in (3, 4, 100, 2000):
+            x_out, y_out = downsample_lttb(self.x, self.y, n_out)
+            self._check_shape(x_out, y_out, n_out)
+    
+    def test_small_input_unchanged(self):
+        """Series no longer than n_out are returned as is."""
+        x_out, y_out = downsample_lttb(self.x[:50], self.y[:50], 50)
+        np.testing.assert_array_equal(x_out, self.x[:50])
+        np.testing.assert_array_equal(y_out, self.y[:50])
+    
+    def test_spike_preserved(self):
+        """An isolated spike survives the downsampling."""
+        self.y[4321] = 50.0
+        x_out, y_out = downsample_lttb(self.x, self.y, 200)
+        self.assertIn(4321.0, x_out)
+        self.assertEqual(y_out.max(), 50.0)
+    
+    def test_non_finite_values(self):
+        """NaN and inf values neither raise nor change the result size."""
+        self.y[[10, 500, 501, 7000]] = [np.nan, np.inf, -np.inf, np.nan]
+        for n_out in (3, 4, 100, 2000):
+            x_out, y_out = downsample_lttb(self.x, self.y, n_out)
+            self._check_shape(x_out, y_out, n_out)
+    
+    def test_all_nan(self):
+        """A series of NaNs still yields n_out points."""
+        y = np.full(len(self.x), np.nan)
+        for n_out in (3, 5, 100):
+            x_out, y_out = downsample_lttb(self.x, y, n_out)
+            self._check_shape(x_out, y_out, n_out)
+
+
+if __name__ == '__main__':
+    unittest.main()
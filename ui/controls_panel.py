@@ -2,13 +2,17 @@
 Control panel for the pendulum data analysis application.
 """
 
+from functools import partial
+
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QGroupBox, QHBoxLayout,
     QCheckBox, QLabel, QLineEdit, QPushButton
 )
-from PyQt5.QtCore import pyqtSignal
+from PyQt5.QtCore import pyqtSignal, QSignalBlocker, QTimer
 from PyQt5.QtGui import QDoubleValidator, QFont
 
+from utils.config import Config
+
 
 class ControlsPanel(QWidget):
     """
@@ -19,6 +23,9 @@ class ControlsPanel(QWidget):
     plotSettingsChanged = pyqtSignal()
     filterSettingsChanged = pyqtSignal()
     
+    # Monospace font shared by all filter inputs, created on first use
+    _MONO_FONT = None
+    
     def __init__(self, parent=None):
         """
         Initialize the controls panel.
@@ -34,11 +41,33 @@ class ControlsPanel(QWidget):
         # Store filter controls
         self.filter_controls = {}
         
+        # Plot selection last reported through plotSettingsChanged, and
+        # whether a coalesced report is already scheduled
+        self._last_enabled = {}
+        self._pending_emit = False
+        
+        # Parsed values of bound input texts, keyed by text
+        self._bound_values = {}
+        
+        # Filter changes are reported once edits have settled
+        self._filter_debounce = QTimer(self)
+        self._filter_debounce.setSingleShot(True)
+        self._filter_debounce.setInterval(Config.FILTER_DEBOUNCE_MS)
+        self._filter_debounce.timeout.connect(self.filterSettingsChanged)
+        
         # Initialize UI
         self._init_ui()
+        
+        # (plot_id, checkbox) pairs and filter axes in display order, for
+        # iterating the controls
+        self._plot_checkbox_items = tuple(self.plot_checkboxes.items())
+        self._filter_axes = tuple(self.filter_controls)
+        self._last_enabled = self.get_enabled_plots()
     
     def _init_ui(self):
         """Initialize the UI components."""
+        # Hold back repaints until all controls are in place
+        self.setUpdatesEnabled(False)
         main_layout = QVBoxLayout()
         
         # Create plot selection group
@@ -53,6 +82,7 @@ class ControlsPanel(QWidget):
         main_layout.addStretch(1)
         
         self.setLayout(main_layout)
+        self.setUpdatesEnabled(True)
     
     def _create_plot_selection_group(self):
         """
@@ -65,11 +95,10 @@ class ControlsPanel(QWidget):
         layout = QVBoxLayout()
         
         # Create checkboxes for each plot type
-        from utils.config import Config
-        for plot_id, plot_info in Config.PLOT_TYPES.items():
-            checkbox = QCheckBox(plot_info['name'])
-            checkbox.setChecked(plot_info['enabled_by_default'])
-            checkbox.setToolTip(plot_info['description'])
+        for plot_id, plot_type in Config.PLOT_TYPE_ITEMS:
+            checkbox = QCheckBox(plot_type.name)
+            checkbox.setChecked(plot_type.enabled_by_default)
+            checkbox.setToolTip(plot_type.description)
             checkbox.stateChanged.connect(self._on_plot_selection_changed)
             
             layout.addWidget(checkbox)
@@ -88,6 +117,11 @@ class ControlsPanel(QWidget):
         group_box = QGroupBox("Data Filters")
         layout = QVBoxLayout()
         
+        # One validator serves all bound inputs. Fixed bounds and standard
+        # notation reject partial input such as "1e" outright.
+        validator = QDoubleValidator(-1.0e9, 1.0e9, 6, self)
+        validator.setNotation(QDoubleValidator.StandardNotation)
+        
         # Add filter controls for semi-major and semi-minor axes
         for axis_name, axis_label in [
             ('semi_major_axis', 'Semi-Major Axis'),
@@ -107,12 +141,9 @@ class ControlsPanel(QWidget):
             min_input = QLineEdit()
             min_input.setFixedWidth(85)  # Width to accommodate ~7 digits + decimal point + 2 decimals
             # Set a monospace font for better number alignment
-            font = QFont("Consolas")
-            font.setPointSize(9)
+            font = self._mono_font()
             min_input.setFont(font)
-            # Set validator without decimal restriction to allow proper input
-            min_validator = QDoubleValidator()
-            min_input.setValidator(min_validator)
+            min_input.setValidator(validator)
             min_input.editingFinished.connect(self._on_filter_changed)
             filter_layout.addWidget(min_input)
             
@@ -121,9 +152,7 @@ class ControlsPanel(QWidget):
             max_input = QLineEdit()
             max_input.setFixedWidth(85)  # Width to accommodate ~7 digits + decimal point + 2 decimals
             max_input.setFont(font)  # Same font as min input
-            # Set validator without decimal restriction to allow proper input
-            max_validator = QDoubleValidator()
-            max_input.setValidator(max_validator)
+            max_input.setValidator(validator)
             max_input.editingFinished.connect(self._on_filter_changed)
             filter_layout.addWidget(max_input)
             
@@ -131,7 +160,7 @@ class ControlsPanel(QWidget):
             reset_btn = QPushButton("IQR")
             reset_btn.setMaximumWidth(40)
             reset_btn.setToolTip("Reset to IQR bounds")
-            reset_btn.clicked.connect(lambda checked, axis=axis_name: self._reset_filter_bounds(axis))
+            reset_btn.clicked.connect(partial(self._reset_filter_bounds, axis_name))
             filter_layout.addWidget(reset_btn)
             
             # Add stretch to push everything to the left
@@ -155,26 +184,67 @@ class ControlsPanel(QWidget):
         group_box.setLayout(layout)
         return group_box
     
+    @classmethod
+    def _mono_font(cls):
+        """
+        Get the monospace font for the filter inputs, creating it once.
+        
+        Returns:
+            QFont: The shared font
+        """
+        if cls._MONO_FONT is None:
+            font = QFont("Consolas")
+            font.setPointSize(9)
+            cls._MONO_FONT = font
+        return cls._MONO_FONT
+    
     def _on_plot_selection_changed(self):
-        """Handle plot selection changes."""
+        """
+        Handle plot selection changes.
+        Rapid changes are coalesced into one report once control returns
+        to the event loop.
+        """
+        if self._pending_emit:
+            return
+        self._pending_emit = True
+        QTimer.singleShot(0, self._flush_plot_selection)
+    
+    def _flush_plot_selection(self):
+        """Emit plotSettingsChanged if the set of enabled plots has changed."""
+        self._pending_emit = False
+        enabled = self.get_enabled_plots()
+        if enabled == self._last_enabled:
+            return
+        
+        self._last_enabled = enabled
         # Emit signal to notify of changes
         self.plotSettingsChanged.emit()
     
     def _on_filter_changed(self):
-        """Handle filter setting changes when editing is finished."""
-        # Emit signal to notify of changes
-        self.filterSettingsChanged.emit()
+        """
+        Handle filter setting changes when editing is finished.
+        filterSettingsChanged is emitted once no further change has followed
+        for Config.FILTER_DEBOUNCE_MS.
+        """
+        # (Re)start the debounce timer
+        self._filter_debounce.start()
     
 
-    def _reset_filter_bounds(self, axis_name):
-        """Reset filter bounds to IQR values."""
+    def _reset_filter_bounds(self, axis_name, checked=False):
+        """
+        Reset filter bounds to IQR values.
+        
+        Args:
+            axis_name (str): Axis whose bounds to reset
+            checked (bool, optional): Button check state passed by clicked; unused
+        """
         # Signal that we want to reset to IQR bounds
         # The MainWindow will handle this by checking for empty values
         if axis_name in self.filter_controls:
             # Clear the inputs to signal a reset
             self.filter_controls[axis_name]['min_input'].clear()
             self.filter_controls[axis_name]['max_input'].clear()
-        self.filterSettingsChanged.emit()
+        self._filter_debounce.start()
     
     def get_enabled_plots(self):
         """
@@ -183,10 +253,7 @@ class ControlsPanel(QWidget):
         Returns:
             dict: Dictionary of plot IDs and their enabled state
         """
-        return {
-            plot_id: checkbox.isChecked()
-            for plot_id, checkbox in self.plot_checkboxes.items()
-        }
+        return {plot_id: checkbox.isChecked() for plot_id, checkbox in self._plot_checkbox_items}
     
     def get_filter_settings(self):
         """
@@ -196,40 +263,69 @@ class ControlsPanel(QWidget):
             dict: Filter settings for each axis
         """
         settings = {}
-        for axis_name, controls in self.filter_controls.items():
+        for axis_name in self._filter_axes:
+            controls = self.filter_controls[axis_name]
             enabled = controls['checkbox'].isChecked()
             min_text = controls['min_input'].text()
             max_text = controls['max_input'].text()
             
             settings[axis_name] = {
                 'enabled': enabled,
-                'min': float(min_text) if min_text else None,
-                'max': float(max_text) if max_text else None
+                'min': self._parse_bound(min_text),
+                'max': self._parse_bound(max_text)
             }
         return settings
     
+    def _parse_bound(self, text):
+        """
+        Parse the text of a bound input, reusing earlier results for the same text.
+        
+        Args:
+            text (str): Text of the input
+            
+        Returns:
+            float: The bound, or None if the input is empty
+        """
+        if not text:
+            return None
+        
+        value = self._bound_values.get(text)
+        if value is None:
+            if len(self._bound_values) >= 64:
+                self._bound_values.clear()
+            value = self._bound_values[text] = float(text)
+        return value
+    
     def update_filter_controls(self, filter_settings):
         """
         Update the filter controls from filter settings.
+        Signals are blocked meanwhile, so this does not report a filter change.
         
         Args:
             filter_settings (dict): Filter settings from FilterManager
         """
+        fmt = "{:.2f}".format
         for axis_name, settings in filter_settings.items():
             if axis_name in self.filter_controls:
                 controls = self.filter_controls[axis_name]
                 
                 # Update checkbox
-                controls['checkbox'].setChecked(settings.get('enabled', False))
+                with QSignalBlocker(controls['checkbox']):
+                    controls['checkbox'].setChecked(settings.get('enabled', False))
                 
                 # Update min/max inputs
                 min_val = settings.get('min')
                 max_val = settings.get('max')
                 
-                if min_val is not None:
-                    controls['min_input'].setText(f"{min_val:.2f}")
-                if max_val is not None:
-                    controls['max_input'].setText(f"{max_val:.2f}")
+                # Leave inputs that already show the value untouched
+                for value, line_edit in ((min_val, controls['min_input']),
+                                         (max_val, controls['max_input'])):
+                    if value is None:
+                        continue
+                    text = fmt(value)
+                    if line_edit.text() != text:
+                        with QSignalBlocker(line_edit):
+                            line_edit.setText(text)
     
     def update_filter_stats(self, stats):
         """
@@ -249,6 +345,7 @@ class ControlsPanel(QWidget):
     def update_from_plot_manager(self, plot_manager):
         """
         Update the UI from the plot manager state.
+        Signals are blocked meanwhile, so this does not report a plot selection change.
         
         Args:
             plot_manager: The plot manager to get state from
@@ -257,4 +354,8 @@ class ControlsPanel(QWidget):
         available_plots = plot_manager.get_available_plots()
         for plot_id, plot_info in available_plots.items():
             if plot_id in self.plot_checkboxes:
-                self.plot_checkboxes[plot_id].setChecked(plot_info['enabled'])
+                with QSignalBlocker(self.plot_checkboxes[plot_id]):
+                    self.plot_checkboxes[plot_id].setChecked(plot_info['enabled'])
+        
+        # The checkboxes now match the plot manager
+        self._last_enabled = self.get_enabled_plots()
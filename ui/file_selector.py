@@ -2,6 +2,8 @@
 File selector dialog for the pendulum data analysis application.
 """
 
+import os
+
 from PyQt5.QtWidgets import (QFileDialog, QWidget)
 
 
@@ -10,8 +12,11 @@ class FileSelector:
     Handles file selection for the pendulum data analysis application.
     """
     
-    @staticmethod
-    def get_csv_file(parent_widget: QWidget = None):
+    # Default directory of the dialog, resolved on first use ("" if there is none)
+    _cached_default_dir = None
+    
+    @classmethod
+    def get_csv_file(cls, parent_widget: QWidget = None):
         """
         Open a file dialog to select a CSV file.
         
@@ -21,22 +26,17 @@ class FileSelector:
         Returns:
             str: Selected file path, or None if no file was selected
         """
-        import os
-        options = QFileDialog.Options()
-        options |= QFileDialog.ReadOnly
-        
         # Default to the data directory if it exists
-        default_dir = ""
-        data_dir = os.path.join(os.getcwd(), "data")
-        if os.path.exists(data_dir) and os.path.isdir(data_dir):
-            default_dir = data_dir
+        if cls._cached_default_dir is None:
+            data_dir = os.path.join(os.getcwd(), "data")
+            cls._cached_default_dir = data_dir if os.path.isdir(data_dir) else ""
         
+        # No options, so the platform's native dialog can be used
         file_path, _ = QFileDialog.getOpenFileName(
             parent_widget,
             "Open Pendulum Data File",
-            default_dir,
-            "CSV Files (*.csv);;All Files (*)",
-            options=options
+            cls._cached_default_dir,
+            "CSV Files (*.csv);;All Files (*)"
         )
         
         if file_path:
@@ -0,0 +1,40 @@
+"""
+Background file loading for the pendulum data analysis application.
+"""
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from core.data_loader import DataLoader
+
+
+class LoadSignals(QObject):
+    """
+    Signals of a LoadWorker.
+    QRunnable is not a QObject, so the worker emits through this helper.
+    """
+    
+    # File path, the DataLoader holding the data, and whether loading succeeded
+    finished = pyqtSignal(str, object, bool)
+
+
+class LoadWorker(QRunnable):
+    """
+    Loads a CSV file into a new DataLoader on a thread pool thread.
+    """
+    
+    def __init__(self, file_path):
+        """
+        Initialize the load worker.
+        
+        Args:
+            file_path (str): Path to the CSV file
+        """
+        super().__init__()
+        self.file_path = file_path
+        self.signals = LoadSignals()
+    
+    def run(self):
+        """Load the file and report the result through signals.finished."""
+        data_loader = DataLoader()
+        success = data_loader.load_csv(self.file_path)
+        self.signals.finished.emit(self.file_path, data_loader, success)
@@ -2,21 +2,23 @@
 Main window for the pendulum data analysis application.
 """
 
+import logging
 import os
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QHBoxLayout, QVBoxLayout,
-    QAction, QFileDialog, QMessageBox, QLabel, QStatusBar
+    QAction, QApplication, QFileDialog, QMessageBox, QLabel, QStatusBar
 )
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import Qt, QEventLoop, QThreadPool, QTimer
 from PyQt5.QtGui import QIcon
 
-from ui.plot_panel import PlotPanel
 from ui.controls_panel import ControlsPanel
 from ui.file_selector import FileSelector
+from ui.load_worker import LoadWorker
 from core.data_loader import DataLoader
 from core.plot_manager import PlotManager
 from core.filter_manager import FilterManager
-from utils.plot_helpers import fix_bottom_axis_ticks
+
+logger = logging.getLogger(__name__)
 
 
 class MainWindow(QMainWindow):
@@ -28,8 +30,9 @@ class MainWindow(QMainWindow):
         """Initialize the main window."""
         super().__init__()
         
-        # Initialize components
-        self.plot_panel = PlotPanel(self)
+        # Initialize components. The plot panel (and with it matplotlib's
+        # figure and Qt backend) is created once the window is first shown.
+        self.plot_panel = None
         self.controls_panel = ControlsPanel(self)
         self.data_loader = DataLoader()
         self.plot_manager = PlotManager()
@@ -38,6 +41,18 @@ class MainWindow(QMainWindow):
         # Track current file
         self.current_file = None
         
+        # Worker of the file load in progress, if any
+        self._load_worker = None
+        
+        # Enabled plots and plotted data of the last plot update, used to
+        # skip updates that would redraw the same plots
+        self._last_plot_spec = None
+        
+        # Whether a plot update is running, and whether another one was
+        # requested meanwhile (events are processed while plots are created)
+        self._updating_plots = False
+        self._update_pending = False
+        
         # Initialize UI
         self._init_ui()
         self._setup_connections()
@@ -48,12 +63,19 @@ class MainWindow(QMainWindow):
         self.setWindowTitle("Pendulum Data Analysis")
         self.setMinimumSize(1000, 800)  # Increased height for better plot display
         
+        # Hold back repaints until the window contents are in place
+        self.setUpdatesEnabled(False)
+        
         # Create central widget
         central_widget = QWidget()
         main_layout = QHBoxLayout()
         
-        # Create the plot panel (left side)
-        main_layout.addWidget(self.plot_panel, 8)  # 80% of width
+        # Placeholder for the plot panel (left side)
+        self._plot_placeholder = QLabel("Loading plots...")
+        self._plot_placeholder.setAlignment(Qt.AlignCenter)
+        self._plot_placeholder.setStyleSheet("QLabel { color: gray; font-size: 14px; }")
+        main_layout.addWidget(self._plot_placeholder, 8)  # 80% of width
+        self._main_layout = main_layout
         
         # Create the controls panel (right side)
         main_layout.addWidget(self.controls_panel, 2)  # 20% of width
@@ -68,6 +90,32 @@ class MainWindow(QMainWindow):
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("Ready")
+        
+        self.setUpdatesEnabled(True)
+    
+    def showEvent(self, event):
+        """Schedule creation of the plot panel once the window is first shown."""
+        super().showEvent(event)
+        if self.plot_panel is None and self._plot_placeholder is not None:
+            QTimer.singleShot(0, self._create_plot_panel)
+    
+    def _create_plot_panel(self):
+        """Create the plot panel in place of its placeholder."""
+        if self.plot_panel is not None:
+            return
+        
+        from ui.plot_panel import PlotPanel
+        self.plot_panel = PlotPanel(self)
+        
+        # Create the plot panel (left side)
+        self._main_layout.insertWidget(0, self.plot_panel, 8)  # 80% of width
+        self._main_layout.removeWidget(self._plot_placeholder)
+        self._plot_placeholder.deleteLater()
+        self._plot_placeholder = None
+        
+        # Plot data that was loaded before the panel existed
+        if self.data_loader.is_loaded:
+            self._update_plots()
     
     def _create_menu_bar(self):
         """Create the menu bar."""
@@ -117,7 +165,10 @@ class MainWindow(QMainWindow):
         """Set up signal-slot connections."""
         # Connect control panel signals
         self.controls_panel.plotSettingsChanged.connect(self._on_plot_settings_changed)
-        self.controls_panel.filterSettingsChanged.connect(self._on_filter_settings_changed)
+        # Queued, so a replot never runs inside the handler of the input event
+        self.controls_panel.filterSettingsChanged.connect(
+            self._on_filter_settings_changed, Qt.QueuedConnection
+        )
     
     def open_file(self):
         """Open a pendulum data file."""
@@ -128,6 +179,8 @@ class MainWindow(QMainWindow):
     def _load_data(self, file_path):
         """
         Load data from a file.
+        The file is read on a worker thread so the window stays responsive;
+        the result is handled by _on_data_loaded on the GUI thread.
         
         Args:
             file_path (str): Path to the data file
@@ -135,10 +188,33 @@ class MainWindow(QMainWindow):
         # Update status
         self.status_bar.showMessage(f"Loading {os.path.basename(file_path)}...")
         
-        # Load the data
-        if self.data_loader.load_csv(file_path):
+        # Load the data into a new DataLoader in the background
+        worker = LoadWorker(file_path)
+        worker.signals.finished.connect(self._on_data_loaded)
+        self._load_worker = worker
+        QThreadPool.globalInstance().start(worker)
+    
+    def _on_data_loaded(self, file_path, data_loader, success):
+        """
+        Handle the result of a background file load.
+        
+        Args:
+            file_path (str): Path to the data file
+            data_loader (DataLoader): Loader holding the loaded data
+            success (bool): Whether the file was loaded
+        """
+        # Ignore the result of a load that a newer one has superseded
+        if self._load_worker is None or self.sender() is not self._load_worker.signals:
+            return
+        self._load_worker = None
+        
+        if success:
+            # Switch to the new data
+            self.data_loader = data_loader
+            
             # Update current file
             self.current_file = file_path
+            self._last_plot_spec = None
             
             # Initialize filter manager with the new data
             self.filter_manager.set_data(self.data_loader.get_data())
@@ -146,10 +222,7 @@ class MainWindow(QMainWindow):
             # Update filter controls with IQR bounds
             self.controls_panel.update_filter_controls(self.filter_manager.get_filter_settings())
             
-            # Show the plots
-            self.plot_panel.show_no_data(False)
-            
-            # Update the plots
+            # Update the plots (this also shows them in place of the no-data message)
             self._update_plots()
             
             # Update status
@@ -167,25 +240,59 @@ class MainWindow(QMainWindow):
             self.status_bar.showMessage("Error loading file")
     
     def _update_plots(self):
-        """Update the plots based on current settings."""
-        if not self.data_loader.is_loaded:
-            print("No data loaded, cannot update plots")
+        """
+        Update the plots based on current settings.
+        An update requested while one is running is deferred until it has
+        finished, and then runs once with the latest settings.
+        """
+        if self._updating_plots:
+            self._update_pending = True
             return
         
-        print("\n=== Updating plots ===")
+        # The canvas is not repainted while the figure changes, as events are
+        # processed while it is only partly built; refresh() draws it once after
+        canvas = self.plot_panel.canvas if self.plot_panel is not None else None
+        if canvas is not None:
+            canvas.setUpdatesEnabled(False)
+        
+        self._updating_plots = True
+        try:
+            self._do_update_plots()
+            while self._update_pending:
+                self._update_pending = False
+                self._do_update_plots()
+        finally:
+            self._updating_plots = False
+            self._update_pending = False
+            if canvas is not None:
+                canvas.setUpdatesEnabled(True)
+    
+    def _do_update_plots(self):
+        """Update the plots once based on current settings."""
+        if not self.data_loader.is_loaded:
+            logger.debug("No data loaded, cannot update plots")
+            return
+        if self.plot_panel is None:
+            logger.debug("Plot panel not created yet, deferring plot update")
+            return
         
         # Get the filtered data
         data = self.filter_manager.get_filtered_data()
         if data is None:
-            print("No data loaded")
+            logger.debug("No data loaded")
+            # The axes stay in the plot manager's pool, hidden behind the
+            # no-data message; the next update pushes the data into them again
+            self._last_plot_spec = None
             self.plot_panel.show_no_data(True, filtered=False)
             return
         elif len(data) == 0:
-            print("No data available after filtering")
+            logger.debug("No data available after filtering")
+            # The axes stay pooled but hidden, as above
+            self._last_plot_spec = None
             self.plot_panel.show_no_data(True, filtered=True)
             return
         else:
-            print(f"Data for plotting: {data.shape} rows, columns: {data.columns.tolist()}")
+            logger.debug("Data for plotting: %d rows", len(data))
             # Make sure we're showing the plots, not the no-data message
             self.plot_panel.show_no_data(False)
             
@@ -194,56 +301,79 @@ class MainWindow(QMainWindow):
         
         # Update the plot manager with current UI settings
         enabled_plots = self.controls_panel.get_enabled_plots()
-        print(f"Enabled plots: {enabled_plots}")
-        
-        for plot_id, enabled in enabled_plots.items():
-            self.plot_manager.set_plot_enabled(plot_id, enabled)
-        
-        # Create the plots
-        figure = self.plot_panel.get_figure()
-        print(f"Creating plots with PlotManager...")
-        created_plots, all_axes = self.plot_manager.create_plots(data, figure)
-        print(f"Created {len(created_plots)} plots with {len(all_axes)} axes")
-        
-        # Register axes for synchronization
-        self.plot_panel.register_axes(all_axes)
+        logger.debug("Enabled plots: %s", enabled_plots)
+        
+        # Nothing to redraw if the same plots already show the same data.
+        # FilterManager returns the same DataFrame object for unchanged
+        # settings, so its identity covers both the filters and the data.
+        plot_spec = (tuple(enabled_plots.items()), data)
+        same_plots = (self._last_plot_spec is not None and
+                      plot_spec[0] == self._last_plot_spec[0])
+        if same_plots and plot_spec[1] is self._last_plot_spec[1]:
+            logger.debug("Plot settings and data unchanged, skipping update")
+            return
         
-        # Force tick labels to appear on bottom plot
-        fix_bottom_axis_ticks(all_axes)
+        if same_plots and self.plot_manager.update_plot_data(data):
+            # Same plots as before: only the data changed
+            logger.debug("Updated plot data in place")
+        else:
+            for plot_id, enabled in enabled_plots.items():
+                self.plot_manager.set_plot_enabled(plot_id, enabled)
+            
+            # Create the plots
+            figure = self.plot_panel.get_figure()
+            created_plots, all_axes = self.plot_manager.create_plots(
+                data, figure, on_plot_created=self._process_pending_events
+            )
+            logger.debug("Created %d plots with %d axes", len(created_plots), len(all_axes))
+            
+            # Register axes for synchronization
+            self.plot_panel.register_axes(all_axes)
+        self._last_plot_spec = plot_spec
         
         # Refresh the display
         self.plot_panel.refresh()
-        print("Plots refreshed successfully")
-        print("=== Plot update complete ===")
+    
+    def _process_pending_events(self):
+        """
+        Let the event loop run between plot creations, so timers and repaints
+        are not held up by a long replot. User input waits until the update is done.
+        """
+        QApplication.processEvents(QEventLoop.ExcludeUserInputEvents)
     
     def _on_plot_settings_changed(self):
         """Handle plot settings changes."""
+        # Plot settings don't touch the data, so the plots are up to date
+        # if they already show the enabled plots
+        enabled_key = tuple(self.controls_panel.get_enabled_plots().items())
+        if self._last_plot_spec is not None and enabled_key == self._last_plot_spec[0]:
+            logger.debug("Enabled plots unchanged, skipping update")
+            return
         self._update_plots()
     
     def _on_filter_settings_changed(self):
         """Handle filter settings changes."""
-        print("\n=== Filter settings changed ===")
-        
         # Get current filter settings from UI
         ui_settings = self.controls_panel.get_filter_settings()
         
+        # Current stored settings of every axis (the per-axis dicts are live)
+        current_all = self.filter_manager.get_filter_settings()
+        
         # Update filter manager
         for axis_name, settings in ui_settings.items():
-            print(f"\n{axis_name}:")
-            print(f"  UI enabled: {settings['enabled']}")
-            print(f"  UI min: {settings['min']}")
-            print(f"  UI max: {settings['max']}")
+            logger.debug("%s filter from UI: enabled=%s, min=%s, max=%s", axis_name,
+                         settings['enabled'], settings['min'], settings['max'])
             
             self.filter_manager.set_filter_enabled(axis_name, settings['enabled'])
             
             # Get current stored settings
-            current_settings = self.filter_manager.get_filter_settings()[axis_name]
+            current_settings = current_all[axis_name]
             
             # Check if we should reset to IQR bounds (both fields empty)
             if settings['min'] is None and settings['max'] is None:
                 # Reset to IQR bounds if available
                 if current_settings['iqr_min'] is not None:
-                    print(f"  Resetting to IQR bounds")
+                    logger.debug("Resetting %s to IQR bounds", axis_name)
                     self.filter_manager.set_filter_bounds(
                         axis_name, 
                         current_settings['iqr_min'], 
@@ -260,12 +390,11 @@ class MainWindow(QMainWindow):
         
         # Update the plots
         self._update_plots()
-        
-        print("=== Filter update complete ===")
     
     def _reset_view(self):
         """Reset the plot view."""
-        # Update the plots with auto scaling
+        # Push the data into the plots again, which rescales them to fit it
+        self._last_plot_spec = None
         self._update_plots()
     
     def _show_about(self):
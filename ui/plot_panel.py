@@ -7,7 +7,8 @@ from PyQt5.QtCore import Qt
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
-import matplotlib.pyplot as plt
+
+from utils.config import Config
 
 
 class PlotPanel(QWidget):
@@ -25,7 +26,14 @@ class PlotPanel(QWidget):
         super().__init__(parent)
         
         # Initialize attributes
-        self.figure = Figure(figsize=(10, 14), dpi=100)  # Taller figure for vertical stacking, more height for more compact plots
+        # Subplots are laid out by the constrained engine, set up once here
+        # rather than on every plot rebuild; no gap between stacked plots.
+        self.figure = Figure(
+            figsize=(Config.DEFAULT_PLOT_WIDTH, Config.DEFAULT_PLOT_HEIGHT),
+            dpi=Config.DEFAULT_DPI,
+            layout='constrained'
+        )
+        self.figure.get_layout_engine().set(h_pad=0, hspace=0)
         self.canvas = FigureCanvas(self.figure)
         self.toolbar = NavigationToolbar(self.canvas, self)
         self.no_data_label = QLabel("No data loaded. Select a file to begin.")
@@ -41,6 +49,9 @@ class PlotPanel(QWidget):
         # List to keep track of axes for synchronization
         self.axes_list = []
         
+        # Last (show, filtered) passed to show_no_data, to skip repeats
+        self._no_data_state = None
+        
         # Initialize UI
         self._init_ui()
     
@@ -69,10 +80,14 @@ class PlotPanel(QWidget):
             show (bool): Whether to show the message
             filtered (bool): Whether this is due to filtering
         """
+        state = (show, filtered and show)
+        if state == self._no_data_state:
+            return
+        self._no_data_state = state
+        
         if show:
-            # Clear any existing plots when showing no data message
-            self.clear_plots()
-            # Show appropriate message
+            # Show the appropriate message in place of the plots. The plots
+            # are only hidden, so they can be reused when data is shown again.
             self.no_data_label.setVisible(not filtered)
             self.no_data_after_filter_label.setVisible(filtered)
             self.canvas.setVisible(False)
@@ -99,11 +114,15 @@ class PlotPanel(QWidget):
         """Clear all plots from the figure."""
         self.figure.clear()
         self.axes_list = []  # Clear the axes list
-        self.canvas.draw()
+        self.canvas.draw_idle()
     
     def refresh(self):
-        """Refresh the plot display."""
-        self.canvas.draw()
+        """
+        Refresh the plot display.
+        The redraw happens when control returns to the event loop, so
+        several refreshes in a row are drawn once.
+        """
+        self.canvas.draw_idle()
     
     def register_axes(self, axes):
         """Register axes for synchronization."""
@@ -3,6 +3,28 @@ Configuration utility for the pendulum data analysis application.
 Provides default settings and configuration management.
 """
 
+from dataclasses import dataclass
+from types import MappingProxyType
+
+
+@dataclass(frozen=True)
+class PlotType:
+    """
+    Description of a plot type offered by the application.
+    
+    Attributes:
+        name (str): Display name
+        description (str): Tooltip text
+        enabled_by_default (bool): Whether the plot is shown initially
+    """
+    # Declared by hand, as dataclass(slots=True) needs Python 3.10
+    __slots__ = ('name', 'description', 'enabled_by_default')
+    
+    name: str
+    description: str
+    enabled_by_default: bool
+
+
 class Config:
     """
     Configuration class for the pendulum data analysis application.
@@ -13,39 +35,55 @@ class Config:
     APP_NAME = "Pendulum Data Analysis"
     APP_VERSION = "0.1.0"
     
-    # Default plot settings
-    DEFAULT_PLOT_WIDTH = 8
-    DEFAULT_PLOT_HEIGHT = 6
+    # Default plot settings (figure size in inches). The figure is taller
+    # than wide for vertical stacking.
+    DEFAULT_PLOT_WIDTH = 10
+    DEFAULT_PLOT_HEIGHT = 14
     DEFAULT_DPI = 100
     
+    # Time series longer than this many points per pixel of plot width are
+    # downsampled (LTTB) before plotting
+    PLOT_POINTS_PER_PIXEL = 2
+    
+    # Time series plots draw point markers only below this many points;
+    # denser series are drawn as a plain line
+    MARKER_POINT_LIMIT = 2000
+    
+    # Delay (ms) after the last filter edit before the filters are applied,
+    # so rapid edits cause a single replot
+    FILTER_DEBOUNCE_MS = 200
+    
     # Plot types
-    PLOT_TYPES = {
-        "semi_major_axis": {
-            "name": "Semi-Major Axis",
-            "description": "Plot of semi-major axis over time",
-            "enabled_by_default": True
-        },
-        "semi_minor_axis": {
-            "name": "Semi-Minor Axis",
-            "description": "Plot of semi-minor axis over time",
-            "enabled_by_default": True
-        },
-        "rotation_angle_deg": {
-            "name": "Rotation Angle",
-            "description": "Plot of rotation angle over time",
-            "enabled_by_default": True
-        },
-        "eccentricity": {
-            "name": "Eccentricity",
-            "description": "Plot of eccentricity over time",
-            "enabled_by_default": True
-        }
-    }
+    PLOT_TYPES = MappingProxyType({
+        "semi_major_axis": PlotType(
+            name="Semi-Major Axis",
+            description="Plot of semi-major axis over time",
+            enabled_by_default=True
+        ),
+        "semi_minor_axis": PlotType(
+            name="Semi-Minor Axis",
+            description="Plot of semi-minor axis over time",
+            enabled_by_default=True
+        ),
+        "rotation_angle_deg": PlotType(
+            name="Rotation Angle",
+            description="Plot of rotation angle over time",
+            enabled_by_default=True
+        ),
+        "eccentricity": PlotType(
+            name="Eccentricity",
+            description="Plot of eccentricity over time",
+            enabled_by_default=True
+        )
+    })
+    
+    # (plot_id, plot_type) pairs of PLOT_TYPES, snapshotted once for iteration
+    PLOT_TYPE_ITEMS = tuple(PLOT_TYPES.items())
     
     # Default axis limits
-    DEFAULT_AXIS_LIMITS = {
+    DEFAULT_AXIS_LIMITS = MappingProxyType({
         "x_min": None,  # Auto
         "x_max": None,  # Auto
         "y_min": None,  # Auto
         "y_max": None   # Auto
-    }
+    })
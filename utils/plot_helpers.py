@@ -2,7 +2,7 @@
 Helpers for matplotlib plots.
 """
 
-import matplotlib.pyplot as plt
+import numpy as np
 
 
 def fix_bottom_axis_ticks(axes_list):
@@ -15,11 +15,72 @@ def fix_bottom_axis_ticks(axes_list):
     if not axes_list:
         return
     
-    # Hide tick labels on all but the bottom plot
-    for i, ax in enumerate(axes_list):
-        if i < len(axes_list) - 1:  # Not the bottom axis
-            plt.setp(ax.get_xticklabels(), visible=False)
-            ax.set_xlabel('')
-        else:  # Bottom axis
-            # Let matplotlib handle the labels normally
-            ax.set_xlabel('Time (seconds)')
+    # Hide tick labels and the axis label on all but the bottom plot. Kept
+    # axes may have moved, so every axes is set either way.
+    for ax in axes_list[:-1]:
+        ax.tick_params(axis='x', labelbottom=False)
+        ax.set_xlabel('')
+    
+    bottom_ax = axes_list[-1]
+    bottom_ax.tick_params(axis='x', labelbottom=True)
+    bottom_ax.set_xlabel('Time (seconds)')
+
+
+def downsample_lttb(x, y, n_out):
+    """
+    Downsample a series with Largest-Triangle-Three-Buckets, keeping the
+    points that shape the line (peaks and troughs) rather than every n-th one.
+    The first and last points are always kept; one point is picked from each
+    bucket in between. The triangle of each candidate is formed with the
+    averages of the neighbouring buckets, so all buckets are evaluated at once.
+    
+    Args:
+        x (numpy.ndarray): X values, in ascending order
+        y (numpy.ndarray): Y values
+        n_out (int): Number of points to keep
+        
+    Returns:
+        tuple: Downsampled x and y arrays, or the inputs if they are small enough
+    """
+    n = len(x)
+    if n_out < 3 or n <= n_out:
+        return x, y
+    
+    xf = np.asarray(x, dtype=np.float64)
+    yf = np.asarray(y, dtype=np.float64)
+    
+    # Split the points between the first and last into n_out - 2 buckets,
+    # each holding at least one point
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    starts = edges[:-1]
+    counts = np.diff(edges)
+    
+    # Bucket averages (the slice stops before the last point, which ends the final bucket)
+    avg_x = np.add.reduceat(xf[:-1], starts) / counts
+    avg_y = np.add.reduceat(yf[:-1], starts) / counts
+    
+    # Triangle vertices: the previous bucket's average (the first point for
+    # the first bucket) and the next bucket's average (the last point for the last)
+    a_x = np.concatenate(([xf[0]], avg_x[:-1]))
+    a_y = np.concatenate(([yf[0]], avg_y[:-1]))
+    c_x = np.concatenate((avg_x[1:], [xf[-1]]))
+    c_y = np.concatenate((avg_y[1:], [yf[-1]]))
+    
+    # Twice the triangle area of every candidate point with its bucket's vertices
+    bucket = np.repeat(np.arange(n_out - 2), counts)
+    a_x, a_y, c_x, c_y = a_x[bucket], a_y[bucket], c_x[bucket], c_y[bucket]
+    area = np.abs((a_x - c_x) * (yf[1:-1] - a_y) - (a_x - xf[1:-1]) * (c_y - a_y))
+    
+    # Non-finite values give NaN areas, which would match no maximum; rank
+    # them below every real area (and inf as the largest finite one), so
+    # each bucket still yields exactly one point
+    np.nan_to_num(area, copy=False, nan=-1.0)
+    
+    # Pick the first point of each bucket with the largest area
+    best = np.maximum.reduceat(area, starts - 1)
+    candidates = np.flatnonzero(area == best[bucket])
+    candidate_buckets = bucket[candidates]
+    first = np.concatenate(([True], candidate_buckets[1:] != candidate_buckets[:-1]))
+    
+    idx = np.concatenate(([0], candidates[first] + 1, [n - 1]))
+    return x[idx], y[idx]